@@ -3,9 +3,14 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/Agents/99_ABase.ipynb.
 
 # %% auto 0
-__all__ = ['abase']
+__all__ = ['abase', 'stationary_Ps', 'stationary_Ri', 'trajectory_Ri', 'Evaluation', 'evaluate']
 
 # %% ../../nbs/Agents/99_ABase.ipynb 4
+import os
+import copy
+import time
+import types
+import inspect
 import numpy as np
 import itertools as it
 from functools import partial
@@ -14,8 +19,8 @@ import jax
 from jax import jit
 import jax.numpy as jnp
 
-from typing import Iterable
-from fastcore.utils import *
+from typing import Iterable, NamedTuple
+from fastcore.basics import patch
 
 from ..Utils.Helpers import *
 
@@ -31,7 +36,11 @@ class abase(object):
                  RewardTensor: np.ndarray,  # reward model of the environment
                  DiscountFactors: Iterable[float],  # the agents' discount factors
                  use_prefactor=False,  # use the 1-DiscountFactor prefactor
-                 opteinsum=True):  # optimize einsum functions
+                 opteinsum=True,  # optimize einsum functions
+                 use_omega=True,  # use the other agents' actions summation tensor
+                 value_solver='inv',  # 'inv', 'solve', 'neumann' or 'gmres'
+                 value_tolerance=1e-6,  # tolerance of iterative value solvers
+                 statdist_solver='eig'):  # 'eig', 'solve' or 'power'
                 
         R = jnp.array(RewardTensor)
         T = jnp.array(TransitionTensor)
@@ -60,20 +69,40 @@ class abase(object):
         # use (1-DiscountFactor) prefactor to have values on scale of rewards
         self.pre = 1 - self.gamma if use_prefactor else jnp.ones(N)        
         self.use_prefactor = use_prefactor
+        # share the value computation when all discount factors are equal
+        self._shared_gamma = bool(np.all(self.gamma == self.gamma[0]))
 
         # 'load' the other agents actions summation tensor for speed
-        self.Omega = self._OtherAgentsActionsSummationTensor()
+        self.use_omega = use_omega
+        self.Omega = self._OtherAgentsActionsSummationTensor()\
+            if use_omega else None
         self.has_last_statdist = False
         self._last_statedist = jnp.ones(Z) / Z
         
         # use optimized einsum method
         self.opti = opteinsum  
 
-    @partial(jit, static_argnums=0)    
+        # how to solve for the values
+        assert value_solver in ['inv', 'solve', 'neumann', 'gmres'],\
+            f"Unknown value solver '{value_solver}'"
+        self.value_solver = value_solver
+        self.value_tolerance = value_tolerance
+
+        # how to compute stationary distributions
+        assert statdist_solver in ['eig', 'solve', 'power'],\
+            f"Unknown stationary distribution solver '{statdist_solver}'"
+        self.statdist_solver = statdist_solver
+
+    @jit    
     def Tss(self, 
             Xisa:jnp.ndarray  # Joint strategy
            ) -> jnp.ndarray: # Average transition matrix
         """Compute average transition model `Tss`, given joint strategy `Xisa`"""
+        if self.Z == 1:  # a single state always follows itself
+            return jnp.ones((1, 1), dtype=Xisa.dtype)
+        if not self.use_omega:  # average over one agent after the other
+            return self._ContractStrategies(self.T, Xisa, range(self.N))
+        
         # i = 0  # agent i (not needed)
         s = 1  # state s
         sprim = 2  # next state s'
@@ -83,7 +112,7 @@ class abase(object):
         args = X4einsum + [self.T, [s]+b2d+[sprim], [s, sprim]]
         return jnp.einsum(*args, optimize=self.opti)
     
-    @partial(jit, static_argnums=0)    
+    @jit    
     def Tisas(self,
               Xisa:jnp.ndarray  # Joint strategy
              ) -> jnp.ndarray:  #  Average transition Tisas
@@ -92,24 +121,20 @@ class abase(object):
         a = 1  # its action a
         s = 2  # the current state
         s_ = 3  # the next state
-        j2k = list(range(4, 4+self.N-1))  # other agents
-        b2d = list(range(4+self.N-1, 4+self.N-1 + self.N))  # all actions
-        e2f = list(range(3+2*self.N, 3+2*self.N + self.N-1))  # all other acts
-
-        sumsis = [[j2k[l], s, e2f[l]] for l in range(self.N-1)]  # sum inds
-        otherX = list(it.chain(*zip((self.N-1)*[Xisa], sumsis)))
+        return self._OtherAgentsAverage(Xisa, [], [i, s, a, s_])
 
-        args = [self.Omega, [i]+j2k+[a]+b2d+e2f] + otherX\
-            + [self.T, [s]+b2d+[s_], [i, s, a, s_]]
-        return jnp.einsum(*args, optimize=self.opti)
-
-    @partial(jit, static_argnums=0)    
+    @jit    
     def Ris(self,
             Xisa:jnp.ndarray, # Joint strategy
             Risa:jnp.ndarray=None # Optional reward for speed-up
            ) -> jnp.ndarray: # Average reward
         """Compute average reward `Ris`, given joint strategy `Xisa`""" 
-        if Risa is None:  # for speed up
+        if Risa is None and not self.use_omega:  # one agent after the other
+            return jnp.stack([self._ContractStrategies(
+                self.T * self.R[i], Xisa, range(self.N)).sum(-1)
+                              for i in range(self.N)])
+        
+        elif Risa is None:  # for speed up
             # Variables      
             i = 0; s = 1; sprim = 2; b2d = list(range(3, 3+self.N))
         
@@ -125,49 +150,32 @@ class abase(object):
             args = [Xisa, [i, s, a], Risa, [i, s, a], [i, s]]
             return jnp.einsum(*args, optimize=self.opti)
        
-    @partial(jit, static_argnums=0)    
+    @jit    
     def Risa(self,
              Xisa:jnp.ndarray # Joint strategy
             ) -> jnp.ndarray:  # Average reward
         """Compute average reward `Risa`, given joint strategy `Xisa`"""
-        i = 0; a = 1; s = 2; s_ = 3  # Variables
-        j2k = list(range(4, 4+self.N-1))  # other agents
-        b2d = list(range(4+self.N-1, 4+self.N-1 + self.N))  # all actions
-        e2f = list(range(3+2*self.N, 3+2*self.N + self.N-1))  # all other acts
- 
-        sumsis = [[j2k[l], s, e2f[l]] for l in range(self.N-1)]  # sum inds
-        otherX = list(it.chain(*zip((self.N-1)*[Xisa], sumsis)))
-
-        args = [self.Omega, [i]+j2k+[a]+b2d+e2f] + otherX\
-            + [self.T, [s]+b2d+[s_], self.R, [i, s]+b2d+[s_],
-               [i, s, a]]
-        return jnp.einsum(*args, optimize=self.opti)       
+        i = 0; a = 1; s = 2  # Variables
+        return self._OtherAgentsAverage(Xisa, [], [i, s, a], withR=True)
        
-    @partial(jit, static_argnums=0)            
+    @jit            
     def Vis(self,
             Xisa:jnp.ndarray, # Joint strategy
             Ris:jnp.ndarray=None, # Optional reward for speed-up
             Tss:jnp.ndarray=None, # Optional transition for speed-up
-            Risa:jnp.ndarray=None  # Optional reward for speed-up
+            Risa:jnp.ndarray=None,  # Optional reward for speed-up
+            Vis0:jnp.ndarray=None  # Optional initial guess for iterative solvers
            ) -> jnp.ndarray:  # Average state values
         """Compute average state values `Vis`, given joint strategy `Xisa`"""
         # For speed up
         Ris = self.Ris(Xisa, Risa=Risa) if Ris is None else Ris
         Tss = self.Tss(Xisa) if Tss is None else Tss
         
-        i = 0  # agent i
-        s = 1  # state s
-        sp = 2  # next state s'
-
         n = np.newaxis
-        Miss = np.eye(self.Z)[n,:,:] - self.gamma[:, n, n] * Tss[n,:,:]
-        
-        invMiss = jnp.linalg.inv(Miss)
-               
-        return self.pre[:,n] * jnp.einsum(invMiss, [i, s, sp], Ris, [i, sp],
-                                          [i, s], optimize=self.opti)
+        return self._SolveValues(Tss[n,:,:], Ris, self.gamma, Vik0=Vis0,
+                                 shared=self._shared_gamma)
 
-    @partial(jit, static_argnums=0)        
+    @jit        
     def Qisa(self,
              Xisa:jnp.ndarray, # Joint strategy
              Risa:jnp.ndarray=None, #  Optional reward for speed-up
@@ -188,7 +196,7 @@ class abase(object):
     
     
     # === Helper ===
-    @partial(jit, static_argnums=0)  
+    @jit  
     def _jaxPs(self,
                Xisa,  # Joint strategy
                pS0):  # Last stationary state distribution 
@@ -196,7 +204,14 @@ class abase(object):
         Compute stationary distribution `Ps`, given joint strategy `Xisa`
         using JAX.
         """
+        if self.Z == 1:  # the only state
+            return jnp.ones(1, dtype=Xisa.dtype)
         Tss = self.Tss(Xisa)
+        if self.statdist_solver == 'solve':
+            return solve_stationarydistribution(Tss)
+        elif self.statdist_solver == 'power':
+            return power_stationarydistribution(Tss, pS0)
+        
         _pS = compute_stationarydistribution(Tss)
         nrS = jnp.where(_pS.mean(0)!=-10, 1, 0).sum()
 
@@ -226,6 +241,9 @@ def Ps(self:abase,
     if self.has_last_statdist: # Check whether we found a previous Ps
         # If so, use jited computation
         Ps =  self._jaxPs(Xisa, self._last_statedist)
+    elif self.statdist_solver != 'eig' or self.Z == 1:  # no need for numpy
+        Ps = self.stationary_Ps(Xisa)
+        self.has_last_statdist = True
     else:
         # If not, use the slower numpy implementation once
         Ps = jnp.array(self._numpyPs(Xisa))
@@ -275,30 +293,230 @@ def Ri(self:abase,
        Xisa:jnp.ndarray # Joint strategy `Xisa`
       ) -> jnp.ndarray: # Average reward `Ri`
     """Compute average reward `Ri`, given joint strategy `Xisa`.""" 
+    if self.Z == 1:  # the only state
+        return self.stationary_Ri(Xisa)[0]
     i, s = 0, 1
     return jnp.einsum(self.Ps(Xisa), [s], self.Ris(Xisa), [i, s], [i])
 
-# %% ../../nbs/Agents/99_ABase.ipynb 22
+# %% ../../nbs/Agents/99_ABase.ipynb 23
+@jit
+def stationary_Ps(self:abase,
+                  Xisa:jnp.ndarray, # Joint strategy
+                  Ps0:jnp.ndarray=None # Last stationary state distribution
+                 ) -> jnp.ndarray: # Stationary state distribution
+    """
+    Compute stationary state distribution `Ps`, given joint strategy `Xisa`
+    and last stationary state distribution `Ps0` (default: uniform).
+    """
+    Ps0 = jnp.ones(self.Z) / self.Z if Ps0 is None else Ps0
+    return self._jaxPs(Xisa, Ps0)
+abase.stationary_Ps = stationary_Ps  # to be able to use the jit decorator
+
+@jit
+def stationary_Ri(self:abase,
+                  Xisa:jnp.ndarray, # Joint strategy
+                  Ps0:jnp.ndarray=None # Last stationary state distribution
+                 ) -> tuple: # (Average reward `Ri`, Stationary distribution)
+    """
+    Compute average reward `Ri`, given joint strategy `Xisa` and last
+    stationary state distribution `Ps0`. 
+    """
+    i, s = 0, 1
+    Ps = self.stationary_Ps(Xisa, Ps0)
+    return jnp.einsum(Ps, [s], self.Ris(Xisa), [i, s], [i]), Ps
+abase.stationary_Ri = stationary_Ri  # to be able to use the jit decorator
+
+# %% ../../nbs/Agents/99_ABase.ipynb 26
+@jit
+def trajectory_Ri(self:abase,
+                  Xtraj:jnp.ndarray,  # Trajectory of joint strategies
+                  P0:jnp.ndarray=None  # Last stationary distribution
+                 ) -> tuple:  # (Average rewards, Stationary distributions)
+    """Compute average rewards `Ri` along a trajectory `Xtraj`."""
+    def step(P, X):
+        Ri, P = self.stationary_Ri(X, P)
+        return P, (Ri, P)
+
+    _, P0 = self.stationary_Ri(Xtraj[0], P0)
+    _, (Rti, Pts) = jax.lax.scan(step, P0, Xtraj)
+    return Rti, Pts
+abase.trajectory_Ri = trajectory_Ri  # to be able to use the jit decorator
+
+# %% ../../nbs/Agents/99_ABase.ipynb 29
+@patch
+def _SolveValues(self:abase,
+                 Tkk:jnp.ndarray,  # Transition matrices [i, k, k']
+                 Rik:jnp.ndarray,  # Rewards [i, k]
+                 gamma:jnp.ndarray,  # Discount factors [i]
+                 Vik0:jnp.ndarray=None,  # Optional initial guess
+                 shared:bool=False  # do all agents share one system?
+                ) -> jnp.ndarray:  # Values [i, k]
+    """
+    Solve the Bellman equations `V = pre R + gamma T V` for the values of all
+    agents with the agents' `value_solver`. 
+    
+    Transitions shared by all agents may be given with an agent axis of length 1.
+    If all agents share the transitions and discount factors (`shared=True`),
+    the system is factorized only once and applied to all agents' rewards.
+    """
+    i = 0; k = 1; k_ = 2  # Variables
+    n = np.newaxis
+    K = Tkk.shape[-1]
+    if K == 1:  # a single state: nothing to solve
+        return self.pre[:, n] * Rik / (1 - gamma[:, n] * Tkk[:, :, 0])
+    
+    if shared:  # one system for all agents
+        Tkk = Tkk[0]
+        Mkk = np.eye(K) - gamma[0] * Tkk
+        ixs = [k, k_]
+    else:  # one system for each agent
+        Tkk = jnp.broadcast_to(Tkk, (self.N, K, K))
+        Mkk = np.eye(K)[n,:,:] - gamma[:, n, n] * Tkk
+        ixs = [i, k, k_]
+
+    if self.value_solver == 'inv':
+        invMkk = jnp.linalg.inv(Mkk)
+        Vik = jnp.einsum(invMkk, ixs, Rik, [i, k_], [i, k],
+                         optimize=self.opti)
+
+    elif self.value_solver == 'solve':
+        Vik = jnp.linalg.solve(Mkk, Rik.T).T if shared\
+            else jnp.linalg.solve(Mkk, Rik[:, :, n])[:, :, 0]
+
+    else:  # iterative solvers
+        Vik = Rik if Vik0 is None else Vik0 / self.pre[:, n]
+        # the tolerance cannot undercut the rounding errors of the dtype
+        eps = self._value_ulps * jnp.finfo(Vik.dtype).eps
+        
+        if self.value_solver == 'neumann':
+            def cond(carry):
+                t, V, delta = carry
+                tol = jnp.maximum(self.value_tolerance, eps * jnp.abs(V).max())
+                return jnp.logical_and(delta > tol, t < self._value_maxiter)
+            def body(carry):
+                t, V, delta = carry
+                V_ = Rik + gamma[:, n] * jnp.einsum(Tkk, ixs, V, [i, k_], [i, k])
+                return t+1, V_, jnp.max(jnp.abs(V_ - V))
+
+            carry = (0, Vik, jnp.array(jnp.inf, dtype=Vik.dtype))
+            _, Vik, _ = jax.lax.while_loop(cond, body, carry)
+
+        else:  # gmres
+            # relative residuals are limited by the condition of the system
+            tol = jnp.maximum(self.value_tolerance, eps / (1 - gamma.max()))
+            gmres = partial(jax.scipy.sparse.linalg.gmres, tol=tol,
+                            maxiter=self._value_restarts)
+            Vik = jax.vmap(lambda M, b, x0: gmres(M, b, x0)[0],
+                           in_axes=(None if shared else 0, 0, 0))(Mkk, Rik, Vik)
+            
+    return self.pre[:, n] * Vik
+
+abase._value_maxiter = 10000  # maximum number of iterations of the neumann value solver
+abase._value_restarts = 50  # maximum number of restarts of the gmres value solver
+abase._value_ulps = 4  # rounding errors (in units of the dtype's eps) tolerated by iterative value solvers
+
+# %% ../../nbs/Agents/99_ABase.ipynb 33
+class Evaluation(NamedTuple):
+    """Strategy-average quantities of a joint strategy"""
+    Tss:jnp.ndarray  # Average transition matrix
+    Tisas:jnp.ndarray  # Average transition tensor
+    Risa:jnp.ndarray  # Average state-action rewards
+    Ris:jnp.ndarray  # Average state rewards
+    Vis:jnp.ndarray  # Average state values
+    Qisa:jnp.ndarray  # Average state-action values
+
+# %% ../../nbs/Agents/99_ABase.ipynb 34
+@jit
+def evaluate(self:abase,
+             Xisa:jnp.ndarray, # Joint strategy
+             Vis0:jnp.ndarray=None  # Optional initial guess for iterative solvers
+            ) -> Evaluation:  # Strategy-average quantities
+    """Compute the strategy-average quantities, given joint strategy `Xisa`"""
+    Risa = abase.Risa(self, Xisa)
+    Ris = abase.Ris(self, Xisa, Risa=Risa)
+    Tss = abase.Tss(self, Xisa)
+    Vis = abase.Vis(self, Xisa, Ris=Ris, Tss=Tss, Vis0=Vis0)
+    Tisas = abase.Tisas(self, Xisa)
+    Qisa = abase.Qisa(self, Xisa, Risa=Risa, Vis=Vis, Tisas=Tisas)
+    return Evaluation(Tss=Tss, Tisas=Tisas, Risa=Risa, Ris=Ris, Vis=Vis, Qisa=Qisa)
+abase.evaluate = evaluate  # to be able to use the jit decorator
+
+# %% ../../nbs/Agents/99_ABase.ipynb 44
 @patch
 def trajectory(self:abase,
                Xinit:jnp.ndarray,  # Initial condition
                Tmax:int=100, # the maximum number of iteration steps
                tolerance:float=None, # to determine if a fix point is reached 
                verbose=False,  # Say something during computation?
+               stride:int=1,  # keep every `stride`-th time step
+               filename:str=None,  # stream the trajectory to this `.npy` file
+               checkpoint:str=None,  # periodically save the progress to this file
+               checkpoint_interval:int=1000,  # number of steps between checkpoints
                **kwargs) -> tuple: # (`trajectory`, `fixpointreached`)
     """
     Compute a joint learning trajectory.
     """
-    traj = []
-    t = 0
-    X = Xinit.copy()
+    cache = self.result_cache if filename is None else None
+    if cache is not None:
+        key = self._cache_key('trajectory', Xinit, Tmax=Tmax, 
+                              tolerance=tolerance, stride=stride)
+        result = cache.load(key)
+        if result is not None:
+            return result['trajectory'], result['fixpointreached'][()]
+    
+    traj = TrajectoryWriter(Xinit, Tmax, stride=stride, filename=filename)
+    traj, fixpreached = self._trajectory_loop(
+        traj, np.array(Xinit), 0, Tmax, tolerance, verbose, checkpoint, 
+        checkpoint_interval)
+    
+    if cache is not None:
+        cache.save(key, trajectory=traj, fixpointreached=fixpreached)
+    return traj, fixpreached
+
+@patch
+def _initial_values(self:abase,
+                    X:jnp.ndarray  # Joint strategy
+                   ) -> jnp.ndarray:  # Values
+    """The values at `X`, to warm-start the value solver of the first `step`."""
+    return self.TDerror(X, False, None, True)[1]
+
+@patch
+def _trajectory_loop(self:abase,
+                     traj:TrajectoryWriter,  # Collects the trajectory
+                     X:jnp.ndarray,  # Current joint strategy
+                     t:int,  # Current time step
+                     Tmax:int, # the maximum number of iteration steps
+                     tolerance:float, # to determine if a fix point is reached 
+                     verbose=False,  # Say something during computation?
+                     checkpoint:str=None,  # periodically save the progress to this file
+                     checkpoint_interval:int=1000):  # number of steps between checkpoints
+    """Learning loop of `trajectory`, starting at time step `t`."""
+    t0 = t
     fixpreached = False
+    blocks = self._use_blocks()
+    V = self._initial_values(X)
 
     while not fixpreached and t < Tmax:
+        if checkpoint is not None and t > t0 and t % checkpoint_interval == 0:
+            self._save_checkpoint(checkpoint, kind='trajectory', X=X, t=t, 
+                                  Tmax=Tmax, tolerance=tolerance,
+                                  interval=checkpoint_interval,
+                                  trajectory_file=traj.filename, 
+                                  **{'writer_' + k: v for k, v in 
+                                     traj.state(checkpoint + '.states').items()})
         print(f"\r [computing trajectory] step {t}", end='') if verbose else None 
-        traj.append(X)
+        
+        block = self.trajectory_block
+        if blocks and t + block <= Tmax and (checkpoint is None or
+                t % checkpoint_interval + block <= checkpoint_interval):
+            X, V, steps, fixpreached = self._run_block(traj, X, V, tolerance)
+            t += steps
+            continue
+        
+        traj.append(np.asarray(X))
 
-        X_, TDe = self.step(X)
+        X_, TDe, V = self.step(X, V)
+        X_ = np.asarray(X_)  # checked on the host
         if np.any(np.isnan(X_)):
             fixpreached = True
             break
@@ -311,36 +529,695 @@ def trajectory(self:abase,
 
     print(f" [trajectory computed]") if verbose else None
 
-    return np.array(traj), fixpreached
+    return traj.close(), fixpreached
+
+# %% ../../nbs/Agents/99_ABase.ipynb 47
+abase.trajectory_block = 1000  # learning steps per compiled block of `trajectory`
+abase.block_threshold = 2**16  # largest tensor size (see above) for blocks
+
+@patch
+def _use_blocks(self:abase) -> bool:
+    """Shall `trajectory` run the learning steps in compiled blocks?"""
+    size = self.T.size + (self.Omega.size if self.use_omega else 0)
+    return bool(self.trajectory_block) and size <= self.block_threshold
+
+@partial(jit, static_argnums=3)
+def _trajectory_block(self:abase,
+                      X:jnp.ndarray,  # Joint strategy
+                      V:jnp.ndarray,  # Values of the last step
+                      length:int):  # number of learning steps
+    """
+    The joint strategies after each of `length` learning steps from `X`, 
+    and the values of the last step.
+    """
+    def body(carry, _):
+        X, V = carry
+        X_, TDe, V = self.step(X, V)
+        return (X_, V), X_
+    (X, V), Xs = jax.lax.scan(body, (X, V), None, length=length)
+    return Xs, V
+abase._trajectory_block = _trajectory_block  # Monkey-patching to jit it
+
+@patch
+def _run_block(self:abase,
+               traj:TrajectoryWriter,  # Collects the trajectory
+               X:jnp.ndarray,  # Current joint strategy
+               V:jnp.ndarray,  # Values of the last step
+               tolerance:float  # to determine if a fix point is reached
+              ) -> tuple:  # (joint strategy, values, steps taken, fixpointreached)
+    """Run a block of learning steps of `trajectory`, starting at `X`."""
+    X = np.asarray(X)
+    Xs, V = self._trajectory_block(X, V, self.trajectory_block)
+    Xs = np.asarray(Xs)
+    Xs_before = np.concatenate([X[None], Xs[:-1]])  # the states before each step
+    
+    flat = (len(Xs), -1)
+    nans = np.any(np.isnan(Xs).reshape(flat), axis=-1)
+    stops = nans if tolerance is None else nans |\
+        (np.linalg.norm((Xs - Xs_before).reshape(flat), axis=-1) < tolerance)
+    if not np.any(stops):
+        traj.extend(Xs_before)
+        return Xs[-1], V, len(Xs), False
+    
+    k = np.argmax(stops)  # first step at which `trajectory` stops
+    traj.extend(Xs_before[:k+1])
+    return (Xs_before[k], V, k, True) if nans[k] else (Xs[k], V, k+1, True)
+
+# %% ../../nbs/Agents/99_ABase.ipynb 51
+@partial(jit, static_argnums=2)
+def _compiled_trajectory(self:abase,
+                         Xinit:jnp.ndarray,  # Initial condition
+                         Tmax:int,  # the maximum number of iteration steps
+                         tolerance:float):  # to determine if a fix point is reached
+    """
+    Compute a joint learning trajectory inside a single `jax.lax.while_loop`.
+    """
+    def cond(carry):
+        t, X, V, traj, fixpreached = carry
+        return jnp.logical_and(~fixpreached, t < Tmax)
+
+    def body(carry):
+        t, X, V, traj, fixpreached = carry
+        traj = traj.at[t].set(X)
+
+        X_, TDe, V = self.step(X, V)
+        isnan = jnp.any(jnp.isnan(X_))
+        fixpreached = jnp.logical_or(isnan,
+                                     jnp.linalg.norm(X_ - X) < tolerance)
+
+        return t+1, jnp.where(isnan, X, X_), V, traj, fixpreached
+
+    traj = jnp.zeros((Tmax,) + Xinit.shape, dtype=Xinit.dtype)
+    V = self._initial_values(Xinit)
+    carry = (jnp.array(0), Xinit, V, traj, jnp.array(False))
+    t, X, V, traj, fixpreached = jax.lax.while_loop(cond, body, carry)
+    return traj, fixpreached, t
+abase._compiled_trajectory = _compiled_trajectory  # Monkey-patching to jit it
+
+@patch
+def compiled_trajectory(self:abase,
+                        Xinit:jnp.ndarray,  # Initial condition
+                        Tmax:int=100, # the maximum number of iteration steps
+                        tolerance:float=None, # to determine if a fix point is reached 
+                        **kwargs) -> tuple: # (`trajectory`, `fixpointreached`, `steps`)
+    """
+    Compute a joint learning trajectory, fully compiled on the device.
+    """
+    # a tolerance of zero is never undercut, i.e., no early stopping
+    tolerance = 0.0 if tolerance is None else tolerance
+    traj, fixpreached, t = self._compiled_trajectory(jnp.asarray(Xinit),
+                                                     Tmax, tolerance)
+    t = int(t)
+    return np.asarray(traj)[:t].copy(), bool(fixpreached), t
+
+# %% ../../nbs/Agents/99_ABase.ipynb 55
+@patch
+def _trajectories_loop(self:abase,
+                       Xinits:jnp.ndarray,  # Batch of initial conditions
+                       Tmax:int,  # the maximum number of iteration steps
+                       tolerance:float,  # to determine if a fix point is reached
+                       record:bool=True,  # record the trajectories?
+                       fixpreached:jnp.ndarray=None,  # members done already
+                       steps:jnp.ndarray=None):  # members' steps taken already
+    """
+    Batched learning loop as a `jax.lax.while_loop`, advancing all members
+    with a vectorized `step`, which warm-starts the value solver with the 
+    members' values of the last step. To be used inside jitted functions.
+    """
+    B = Xinits.shape[0]  # batch size
+    n = (slice(None),) + (np.newaxis,)*(Xinits.ndim-1)  # to broadcast masks
+    vstep = jax.vmap(self.step)
+
+    def cond(carry):
+        t, X, V, traj, fixpreached, steps = carry
+        return jnp.logical_and(~jnp.all(fixpreached), t < Tmax)
+
+    def body(carry):
+        t, X, V, traj, fixpreached, steps = carry
+        traj = traj.at[t].set(X) if record else traj
+
+        X_, TDe, V_ = vstep(X, V)
+        isnan = jnp.any(jnp.isnan(X_.reshape(B, -1)), axis=-1)
+        converged = jnp.linalg.norm((X_ - X).reshape(B, -1), axis=-1)\
+            < tolerance
+
+        # members which are done already keep their state
+        active = ~fixpreached
+        steps = steps + active
+        X = jnp.where((active & ~isnan)[n], X_, X)
+        V = jnp.where((active & ~isnan)[n[:-1]], V_, V)
+        fixpreached = fixpreached | isnan | converged
+
+        return t+1, X, V, traj, fixpreached, steps
+
+    traj = jnp.zeros((Tmax,) + Xinits.shape, dtype=Xinits.dtype)\
+        if record else None
+    fixpreached = jnp.zeros(B, bool) if fixpreached is None else fixpreached
+    steps = jnp.zeros(B, int) if steps is None else steps
+    V = jax.vmap(self._initial_values)(Xinits)
+    carry = (jnp.array(0), Xinits, V, traj, fixpreached, steps)
+    t, X, V, traj, fixpreached, steps = jax.lax.while_loop(cond, body, carry)
+    return t, X, traj, fixpreached, steps
+
+@partial(jit, static_argnums=(2, 6))
+def _compiled_trajectories(self:abase,
+                           Xinits:jnp.ndarray,  # Batch of initial conditions
+                           Tmax:int,  # the maximum number of iteration steps
+                           tolerance:float,  # to determine if a fix point is reached
+                           fixpreached:jnp.ndarray=None,  # members done already
+                           steps:jnp.ndarray=None,  # members' steps taken already
+                           record:bool=True):  # record the trajectories?
+    """Compute a batch of joint learning trajectories on the device."""
+    t, X, traj, fixpreached, steps = self._trajectories_loop(
+        Xinits, Tmax, tolerance, record=record, fixpreached=fixpreached, 
+        steps=steps)
+    traj = jnp.swapaxes(traj, 0, 1) if record else None
+    return traj, fixpreached, steps, t, X
+abase._compiled_trajectories = _compiled_trajectories  # Monkey-patching to jit it
+
+@patch
+def trajectories(self:abase,
+                 Xinits:jnp.ndarray,  # Batch of initial conditions
+                 Tmax:int=100, # the maximum number of iteration steps
+                 tolerance:float=None, # to determine if a fix point is reached 
+                 checkpoint:str=None,  # periodically save the progress to this file
+                 checkpoint_interval:int=1000,  # number of steps between checkpoints
+                 workers:int=1,  # number of devices to split the batch across
+                 record:bool=True,  # record the trajectories, or keep the final states only?
+                 **kwargs) -> tuple: # (`trajectories`, `fixpointsreached`, `steps`)
+    """
+    Compute a batch of joint learning trajectories, fully compiled on the device.
+    Without `record`, the final joint strategies are returned instead.
+    """
+    # a tolerance of zero is never undercut, i.e., no early stopping
+    tolerance = 0.0 if tolerance is None else tolerance
+    if checkpoint is not None:
+        Xinits = jnp.array(Xinits)
+        B = len(Xinits)
+        trajs = np.zeros((B, 0) + Xinits.shape[1:], Xinits.dtype)\
+            if record else None
+        return self._trajectories_segments(
+            Xinits, np.zeros(B, bool), np.zeros(B, int), 0, trajs, Tmax, 
+            tolerance, checkpoint, checkpoint_interval)
+    
+    mesh = device_mesh(workers)
+    if mesh is not None:
+        B = len(Xinits)
+        trajs, fixpreached, steps, t = self._sharded_trajectories(
+            pad_batch(jnp.array(Xinits), mesh.size), Tmax, tolerance, mesh, record)
+        trajs, fixpreached, steps, t = trajs[:B], fixpreached[:B], steps[:B], t.max()
+    else:
+        trajs, fixpreached, steps, t, X = self._compiled_trajectories(
+            jnp.asarray(Xinits), Tmax, tolerance, record=record)
+        trajs = trajs if record else X
+    trajs = np.asarray(trajs)[:, :int(t)] if record else trajs  # or the final states
+    return np.array(trajs), np.array(fixpreached), np.array(steps)
+
+# %% ../../nbs/Agents/99_ABase.ipynb 60
+@patch
+def _save_checkpoint(self:abase,
+                     checkpoint:str,  # File to write
+                     **state):  # Progress of the computation
+    """Save the `state` of a computation together with the agents' warm starts."""
+    for name in ['has_last_statdist', '_last_statedist', 
+                 'has_last_obsdist', '_last_obsdist']:
+        if hasattr(self, name):
+            state['agents' + name] = getattr(self, name)
+    
+    rng = np.random.get_state()
+    state.update(rng_keys=rng[1], rng_pos=rng[2], rng_has_gauss=rng[3],
+                 rng_cached_gaussian=rng[4])
+    
+    state = {k: ('' if v is None else v) for k, v in state.items()}
+    save_atomically(checkpoint, **state)
+
+@patch
+def _trajectories_segments(self:abase,
+                           X:jnp.ndarray,  # Current batch of joint strategies
+                           fixpreached:np.ndarray,  # members done already
+                           steps:np.ndarray,  # members' steps taken already
+                           t:int,  # Current time step
+                           trajs:np.ndarray,  # Trajectories so far, None to not record them
+                           Tmax:int,  # the maximum number of iteration steps
+                           tolerance:float,  # to determine if a fix point is reached
+                           checkpoint:str,  # periodically save the progress to this file
+                           checkpoint_interval:int):  # number of steps between checkpoints
+    """Compute batched trajectories in compiled segments between checkpoints."""
+    record = trajs is not None
+    trajs = [trajs]
+    while not np.all(fixpreached) and t < Tmax:
+        segment = self._compiled_trajectories(
+            X, min(checkpoint_interval, Tmax - t), tolerance, 
+            fixpreached=fixpreached, steps=steps, record=record)
+        traj, fixpreached, steps, dt, X = segment
+        trajs.append(np.array(traj[:, :int(dt)]) if record else None)
+        t += int(dt)
+        if not np.all(fixpreached) and t < Tmax:
+            if record:  # only the new segment, time steps first
+                append_rows(checkpoint + '.trajectories', 
+                            trajs[-1].swapaxes(0, 1), t - int(dt))
+            self._save_checkpoint(checkpoint, kind='trajectories', X=X, t=t,
+                                  Tmax=Tmax, tolerance=tolerance, 
+                                  interval=checkpoint_interval, 
+                                  fixpreached=fixpreached, steps=steps,
+                                  record=record)
+    trajs = np.concatenate(trajs, axis=1) if record else np.array(X)
+    return trajs, np.array(fixpreached), np.array(steps)
+
+# %% ../../nbs/Agents/99_ABase.ipynb 61
+@patch
+def resume(self:abase,
+           checkpoint:str,  # File written by `trajectory` or `trajectories`
+           verbose=False):  # Say something during computation?
+    """
+    Continue the computation saved in `checkpoint` and return its result.
+    """
+    with np.load(checkpoint) as c:
+        state = {k: c[k] for k in c.files}
+
+    for name in ['has_last_statdist', '_last_statedist', 
+                 'has_last_obsdist', '_last_obsdist']:
+        if 'agents' + name in state:
+            value = state['agents' + name]
+            setattr(self, name, bool(value) if name.startswith('has') 
+                                else jnp.array(value))
+    np.random.set_state(('MT19937', state['rng_keys'], int(state['rng_pos']),
+                         int(state['rng_has_gauss']),
+                         float(state['rng_cached_gaussian'])))
+
+    X, t, Tmax = jnp.array(state['X']), int(state['t']), int(state['Tmax'])
+    tolerance = None if state['tolerance'].dtype.kind == 'U'\
+        else float(state['tolerance'])
+    interval = int(state['interval'])
+
+    if str(state['kind']) == 'trajectory':
+        filename = str(state['trajectory_file']) or None
+        writer = {k[7:]: v for k, v in state.items() if k.startswith('writer_')}
+        traj = TrajectoryWriter.from_state(X, Tmax, writer, filename=filename,
+                                           statesfile=checkpoint + '.states')
+        return self._trajectory_loop(traj, X, t, Tmax, tolerance, verbose,
+                                     checkpoint, interval)
+    else:
+        trajs = read_rows(checkpoint + '.trajectories', t, X.dtype, X.shape)\
+            .swapaxes(0, 1) if state['record'] else None
+        return self._trajectories_segments(
+            X, state['fixpreached'], state['steps'], t, trajs, Tmax, tolerance,
+            checkpoint, interval)
+
+# %% ../../nbs/Agents/99_ABase.ipynb 66
+abase.result_cache = None  # e.g., `ResultCache()` to cache results on disk
+
+@patch
+def _cache_key(self:abase,
+               *parts,  # identifying the computation with the agents
+               **settings  # of the computation
+              ) -> str:  # Hash of the computation
+    """Key to cache a computation with the agents, from all their attributes."""
+    leaves, (leafnames, static) = self.tree_flatten()
+    agents = [self.__class__.__name__, self._value_maxiter,
+              self._value_restarts, self._value_ulps]
+    for name, leaf in zip(leafnames, leaves):
+        # warm starts do not change the results, `Omega` is given by `N` and `M`
+        if name not in ('_last_statedist', '_last_obsdist', 'Omega'):
+            arrays, treedef = jax.tree_util.tree_flatten(leaf)
+            agents += [name, str(treedef)] + arrays
+    agents += [(name, value) for name, value in static  # e.g., `use_omega`
+               if not isinstance(value, _Uncompared)]  # e.g., `env`
+    return ResultCache.key(*agents, *parts, **settings)
 
-# %% ../../nbs/Agents/99_ABase.ipynb 24
+# %% ../../nbs/Agents/99_ABase.ipynb 69
+abase._compile_methods = ('step', 'reverse_step', 'RPEisa', 'RPEioa', 'Tss', 'Tisas',
+                          'Risa', 'Ris', 'Vis', 'Qisa', 'evaluate', 
+                          'trajectory', 'compiled_trajectory', 'trajectories')
+
+_compile_events = None  # JAX's compilation events, while `compile` records them
+
+def _record_compile_event(event:str, *args, **kwargs):
+    if _compile_events is not None:
+        _compile_events.append(event)
+jax.monitoring.register_event_listener(_record_compile_event)
+jax.monitoring.register_event_duration_secs_listener(_record_compile_event)
+
+@patch
+def _compile_calls(self:abase,
+                   name:str,  # of the method
+                   Tmax:int=None,  # the maximum number of iteration steps
+                   batch:int=1  # number of initial conditions of `trajectories`
+                  ) -> list:  # (jitted function, arguments, keyword arguments)
+    """The calls of jitted functions that the method `name` makes."""
+    cls, dtype = type(self), jnp.result_type(float)
+    X = jax.ShapeDtypeStruct((self.N, self.Q, self.M), dtype)  # for the shapes only
+    V = jax.ShapeDtypeStruct((self.N, self.Q), dtype)  # values of the last step
+    
+    if name == 'trajectory':  # the initial values, the steps and their blocks
+        TDerror = getattr(cls, self.TDerror.__name__)
+        calls = [(TDerror, (self, X, False, None, True), {}),
+                 (cls.step, (self, X, V), {})]
+        block = (cls._trajectory_block, (self, X, V, self.trajectory_block), {})
+        return calls + [block] if self._use_blocks() else calls
+    if name == 'compiled_trajectory':  # for this `Tmax` only
+        return [] if Tmax is None else\
+            [(cls._compiled_trajectory, (self, X, Tmax, 0.0), {})]
+    if name == 'trajectories':  # for this `Tmax` and `batch`, with recording
+        Xs = jax.ShapeDtypeStruct((batch,) + X.shape, dtype)
+        return [] if Tmax is None else\
+            [(cls._compiled_trajectories, (self, Xs, Tmax, 0.0), dict(record=True))]
+    
+    method = getattr(cls, name, None)
+    return [(method, (self, X), {})] if hasattr(method, 'lower') else []
+
+@patch
+def compile(self:abase,
+            methods:Iterable[str]=None,  # names of the methods, all core methods if None
+            verbose:bool=False,  # print the compile times?
+            Tmax:int=None,  # the maximum number of iteration steps of the compiled loops
+            batch:int=1  # number of initial conditions of `trajectories`
+           ) -> dict:  # (compile time in seconds, source of the executable) of each method
+    """
+    Compile the agents' jitted `methods` ahead of time, without running them.
+    
+    The learning loops `trajectory`, `compiled_trajectory` and `trajectories`
+    are compiled for the calls they make. The latter two compile their loop for
+    a given `Tmax` (and `batch` size) only, and are skipped without it.
+    
+    Switches on JAX's persistent compilation cache for the whole process, by
+    setting the global `jax_compilation_cache_dir` (see `use_compilation_cache`),
+    unless a cache directory has been set already. The source of each executable
+    is 'compiled', 'disk' (the persistent cache) or 'memory' (compiled before
+    in this process).
+    """
+    global _compile_events
+    if jax.config.jax_compilation_cache_dir is None:
+        use_compilation_cache()
+    
+    methods = self._compile_methods if methods is None else methods
+    results = {}
+    for name in methods:
+        calls = self._compile_calls(name, Tmax, batch)
+        if not calls:  # not jitted for these agents, or no `Tmax`
+            continue
+        _compile_events = []
+        try:
+            tic = time.perf_counter()
+            for method, args, kwargs in calls:
+                method.lower(*args, **kwargs).compile()
+            toc = time.perf_counter() - tic
+        finally:
+            events, _compile_events = _compile_events, None
+        
+        source = 'memory' if not events else\
+            'disk' if '/jax/compilation_cache/cache_hits' in events else 'compiled'
+        results[name] = (toc, source)
+        print(f"{name:12} {source:8} in {toc:.2f} s") if verbose else None
+    return results
+
+# %% ../../nbs/Agents/99_ABase.ipynb 72
+@patch
+def _with_parameters(self:abase,
+                     **params):  # new values for the agents' attributes
+    """
+    Shallow copy of the agents with replaced parameters `params`, 
+    e.g., `gamma=...`, which may also be traced arrays.
+    """
+    new = copy.copy(self)
+    for name, value in params.items():
+        setattr(new, name, value)
+    if 'gamma' in params and self.use_prefactor:
+        new.pre = 1 - new.gamma
+
+    # rebind methods stored as attributes (such as `TDerror`) to the copy
+    for name, value in vars(self).items():
+        if inspect.ismethod(value) and value.__self__ is self:
+            setattr(new, name, getattr(new, value.__name__))
+    return new
+
+@patch
+def _differentiable(self:abase):
+    """Agents whose learning dynamics can be differentiated."""
+    if self.statdist_solver == 'eig':  # eigenvectors are not differentiable
+        return self._with_parameters(statdist_solver='solve')
+    return self
+
+# %% ../../nbs/Agents/99_ABase.ipynb 73
+@partial(jit, static_argnums=3)
+def _compiled_sweep(self:abase,
+                    Xinits:jnp.ndarray,  # Batch of initial conditions
+                    params:dict,  # parameter attributes with values along 1st axis
+                    Tmax:int,  # the maximum number of iteration steps
+                    tolerance:float):  # to determine if a fix point is reached
+    """Run the batched learning loop for each parameter combination."""
+    def run(values):
+        values = {k: jnp.broadcast_to(v, (self.N,)) for k, v in values.items()}
+        agents = self._with_parameters(**values)
+        t, X, _, fixpreached, steps = agents._trajectories_loop(
+            Xinits, Tmax, tolerance, record=False)
+        return X, fixpreached, steps
+    return jax.vmap(run)(params)
+abase._compiled_sweep = _compiled_sweep  # Monkey-patching to jit it
+
+@patch
+def sweep(self:abase,
+          Xinits:jnp.ndarray,  # Batch of initial conditions
+          Tmax:int=100, # the maximum number of iteration steps
+          tolerance:float=None, # to determine if a fix point is reached 
+          workers:int=1,  # number of devices to split the combinations across
+          **parameters  # values to sweep, e.g., `discount_factors=[0.8, 0.9]`
+          ) -> dict: # labeled results
+    """
+    Compute the final joint states of the learning dynamics for all
+    combinations of `parameters` and initial conditions `Xinits`.
+    """
+    attributes = {'learning_rates': 'alpha', 'discount_factors': 'gamma',
+                  'choice_intensities': 'beta'}
+    for name in parameters:
+        assert name in attributes, f"Can't sweep over '{name}'"
+        assert hasattr(self, attributes[name]), f"No '{name}' for these agents"
+
+    # all parameter combinations, flattened along the first axis
+    values = [jnp.array(v, dtype=float) for v in parameters.values()]
+    grid = np.meshgrid(*[np.arange(len(v)) for v in values], indexing='ij')
+    params = {attributes[name]: v[g.flatten()]
+              for name, v, g in zip(parameters, values, grid)}
+
+    # a tolerance of zero is never undercut, i.e., no early stopping
+    tolerance = 0.0 if tolerance is None else tolerance
+    mesh = device_mesh(workers)
+    if mesh is not None:
+        P = len(grid[0].flatten())  # number of combinations
+        X, fixpreached, steps = self._sharded_sweep(
+            jnp.array(Xinits), pad_batch(params, mesh.size), Tmax, tolerance, mesh)
+        X, fixpreached, steps = X[:P], fixpreached[:P], steps[:P]
+    else:
+        X, fixpreached, steps = self._compiled_sweep(jnp.array(Xinits), params,
+                                                     Tmax, tolerance)
+
+    shape = tuple(len(v) for v in values) + (len(Xinits),)
+    coords = {name: np.array(v) for name, v in zip(parameters, values)}
+    coords['init'] = np.arange(len(Xinits))
+    return dict(dims=tuple(coords), coords=coords,
+                X=np.array(X).reshape(shape + X.shape[2:]),
+                fixpointreached=np.array(fixpreached).reshape(shape),
+                steps=np.array(steps).reshape(shape))
+
+# %% ../../nbs/Agents/99_ABase.ipynb 78
+@partial(jit, static_argnums=(2, 4, 5))
+def _sharded_trajectories(self:abase,
+                          Xinits:jnp.ndarray,  # Batch of initial conditions
+                          Tmax:int,  # the maximum number of iteration steps
+                          tolerance:float,  # to determine if a fix point is reached
+                          mesh:jax.sharding.Mesh,  # to shard the batch across
+                          record:bool=True):  # record the trajectories?
+    """Compute a batch of trajectories with one learning loop per device."""
+    def shard(agents, Xinits, tolerance):
+        t, X, traj, fixpreached, steps = agents._trajectories_loop(
+            Xinits, Tmax, tolerance, record=record)
+        if not record:  # the final states instead
+            return X, fixpreached, steps, t[np.newaxis]
+        # pad with the final states, as if the loop had run as long as on 
+        # the other devices
+        ts = jnp.arange(Tmax).reshape((Tmax,) + (1,)*X.ndim)
+        traj = jnp.where(ts < t, traj, X)
+        return jnp.swapaxes(traj, 0, 1), fixpreached, steps, t[np.newaxis]
+    
+    batch, replicated = jax.sharding.PartitionSpec('batch'), jax.sharding.PartitionSpec()
+    # the loops' carries start replicated, but vary across devices
+    return jax.shard_map(shard, mesh=mesh, 
+                         in_specs=(replicated, batch, replicated),
+                         out_specs=batch, check_vma=False)(self, Xinits, tolerance)
+abase._sharded_trajectories = _sharded_trajectories  # Monkey-patching to jit it
+
+@partial(jit, static_argnums=(3, 5))
+def _sharded_sweep(self:abase,
+                   Xinits:jnp.ndarray,  # Batch of initial conditions
+                   params:dict,  # parameter attributes with values along 1st axis
+                   Tmax:int,  # the maximum number of iteration steps
+                   tolerance:float,  # to determine if a fix point is reached
+                   mesh:jax.sharding.Mesh):  # to shard the combinations across
+    """Run `_compiled_sweep` for a share of the parameter combinations per device."""
+    def shard(agents, Xinits, params, tolerance):
+        return agents._compiled_sweep(Xinits, params, Tmax, tolerance)
+    
+    batch, replicated = jax.sharding.PartitionSpec('batch'), jax.sharding.PartitionSpec()
+    # the loops' carries start replicated, but vary across devices
+    return jax.shard_map(shard, mesh=mesh, 
+                         in_specs=(replicated, replicated, batch, replicated),
+                         out_specs=batch, check_vma=False)(self, Xinits, params, tolerance)
+abase._sharded_sweep = _sharded_sweep  # Monkey-patching to jit it
+
+# %% ../../nbs/Agents/99_ABase.ipynb 80
 @patch
 def _OtherAgentsActionsSummationTensor(self:abase):
     """
     To sum over the other agents and their respective actions using `einsum`.
     """
-    dim = np.concatenate(([self.N],  # agent i
-                          [self.N for _ in range(self.N-1)],  # other agnt
-                          [self.M],  # agent a of agent i
-                          [self.M for _ in range(self.N)],  # all acts
-                          [self.M for _ in range(self.N-1)]))  # other a's
-    Omega = np.zeros(dim.astype(int), int)
-
-    for index, _ in np.ndenumerate(Omega):
-        I = index[0]
-        notI = index[1:self.N]
-        A = index[self.N]
-        allA = index[self.N+1:2*self.N+1]
-        notA = index[2*self.N+1:]
-
-        if len(np.unique(np.concatenate(([I], notI)))) is self.N:
-            # all agents indices are different
-
-            if A == allA[I]:
-                # action of agent i equals some other action
-                cd = allA[:I] + allA[I+1:]  # other actionss
-                areequal = [cd[k] == notA[k] for k in range(self.N-1)]
-                if np.all(areequal):
-                    Omega[index] = 1
-
-    return jnp.array(Omega)
+    filename = os.path.join(cache_directory(), f'Omega_ordered_N{self.N}_M{self.M}.npz')
+    try:  # to load it from the cache
+        Omega = np.load(filename)['Omega']
+    except (OSError, KeyError, ValueError):
+        Omega = _SummationTensor(self.N, self.M)
+        try:
+            save_atomically(filename, Omega=Omega)
+        except OSError:  # no cache then
+            pass
+    return jnp.array(Omega, dtype=int)
+
+def _SummationTensor(N,  # number of agents
+                     M):  # number of actions
+    """Build the other agents actions summation tensor with array operations."""
+    # the other agents indices must be all agents but the focal one, in order
+    agents = np.indices((N,)*N).reshape(N, -1)
+    others = np.array([np.delete(np.arange(N), I) for I in range(N)])
+    ordered = np.all(agents[1:] == others[agents[0]].T, axis=0)
+    ordered = ordered.reshape((N,)*N + (1,)*(2*N))
+
+    # focal agent's action and all other agents' actions must match all actions
+    actions = np.indices((M,)*(2*N))
+    A, allA, notA = actions[0], actions[1:N+1], actions[N+1:]
+    match = np.stack([(A == allA[I]) &
+                      np.all(np.delete(allA, I, axis=0) == notA, axis=0)
+                      for I in range(N)])
+    match = match.reshape((N,) + (1,)*(N-1) + (M,)*(2*N))
+
+    return ordered & match
+
+# %% ../../nbs/Agents/99_ABase.ipynb 88
+@patch
+def _OtherAgentsAverage(self:abase,
+                        Xisa:jnp.ndarray,  # Joint strategy
+                        operands:list,  # further operands, each followed by its indices
+                        out:list,  # output indices
+                        withR:bool=False  # include the reward tensor?
+                       ) -> jnp.ndarray:  # Strategy-average
+    """
+    Average the transition tensor (times `operands`) over the strategies of
+    all other agents, given joint strategy `Xisa`. 
+    
+    Indices: agent i=0, its action a=1, current state s=2, next state s'=3;
+    4 and 5 are free to use, e.g., for observations.
+    """
+    i = 0; a = 1; s = 2; s_ = 3  # Variables
+    
+    if self.Z == 1 and not withR:  # a single state always follows itself
+        Tisas = jnp.ones((self.N, 1, self.M, 1), dtype=Xisa.dtype)
+        args = [Tisas, [i, s, a, s_]] + operands + [out]
+        return jnp.einsum(*args, optimize=self.opti)
+
+    if self.use_omega:
+        b2d = list(range(6, 6+self.N))  # all actions
+        j2k = list(range(6+self.N, 5+2*self.N))  # other agents
+        e2f = list(range(5+2*self.N, 4+3*self.N))  # all other acts
+
+        sumsis = [[j2k[l], s, e2f[l]] for l in range(self.N-1)]  # sum inds
+        otherX = list(it.chain(*zip((self.N-1)*[Xisa], sumsis)))
+        R = [self.R, [i, s]+b2d+[s_]] if withR else []
+
+        args = [self.Omega, [i]+j2k+[a]+b2d+e2f] + otherX\
+            + [self.T, [s]+b2d+[s_]] + R + operands + [out]
+        return jnp.einsum(*args, optimize=self.opti)
+
+    # transitions T[s, a, s'] for each focal agent
+    others = lambda k: [j for j in range(self.N) if j != k]
+    Tisas = jnp.stack([self._ContractStrategies(
+        self.T * self.R[k] if withR else self.T, Xisa, others(k))
+                       for k in range(self.N)])
+    args = [Tisas, [i, s, a, s_]] + operands + [out]
+    return jnp.einsum(*args, optimize=self.opti)
+
+# %% ../../nbs/Agents/99_ABase.ipynb 89
+@patch
+def _ContractStrategies(self:abase,
+                        Tensor:jnp.ndarray,  # with indices [s, a1, ..., aN, ...]
+                        Xisa:jnp.ndarray,  # Joint strategy
+                        agents:Iterable  # whose actions to average out
+                       ) -> jnp.ndarray:  # Tensor without the agents' actions
+    """
+    Average the actions of `agents` out of `Tensor`, one agent after the other.
+    """
+    for j in sorted(agents, reverse=True):  # keeps the lower axes in place
+        inds = list(range(Tensor.ndim))
+        Tensor = jnp.einsum(Tensor, inds, Xisa[j], [0, 1+j],
+                            inds[:1+j] + inds[2+j:])
+    return Tensor
+
+# %% ../../nbs/Agents/99_ABase.ipynb 95
+class _Uncompared(object):
+    """Static pytree data that is not compared between agents objects"""
+    def __init__(self, value): self.value = value
+    def __eq__(self, other): return isinstance(other, _Uncompared)
+    def __hash__(self): return 0
+
+class _BoundMethod(str):
+    """Name of a method, which is stored as an attribute of the agents"""
+
+_leaftypes = {}  # whether the values of a type are leaves (for speed)
+def _isleaf(value):
+    """Is `value` an array or a pytree?"""
+    if type(value) not in _leaftypes:
+        _leaftypes[type(value)] = isinstance(value, (jax.Array, np.ndarray))\
+            or hasattr(type(value), 'tree_flatten')
+    return _leaftypes[type(value)]
+
+@patch
+def tree_flatten(self:abase):
+    """Split the agents into array leaves and static auxiliary data."""
+    attributes = vars(self)
+    previous_leafnames = attributes.get('_leafnames', ())
+    leafnames, leaves, static = [], [], []
+    for name in sorted(attributes):
+        value = attributes[name]
+        if name in previous_leafnames or _isleaf(value):
+            leafnames.append(name); leaves.append(value)
+        elif name == '_leafnames':
+            continue
+        elif type(value) is types.MethodType and value.__self__ is self:
+            static.append((name, _BoundMethod(value.__name__)))  # e.g., TDerror
+        elif name in self._uncompared:
+            static.append((name, _Uncompared(value)))
+        else:
+            static.append((name, value))
+    return leaves, (tuple(leafnames), tuple(static))
+
+@patch(cls_method=True)
+def tree_unflatten(cls:abase, aux, leaves):
+    """Recreate the agents from static auxiliary data and array leaves."""
+    leafnames, static = aux
+    self = object.__new__(cls)
+    self._leafnames = leafnames
+    for name, value in zip(leafnames, leaves):
+        setattr(self, name, value)
+    for name, value in static:
+        if isinstance(value, _BoundMethod):
+            value = getattr(self, value)
+        elif isinstance(value, _Uncompared):
+            value = value.value
+        setattr(self, name, value)
+    return self
+
+@patch(cls_method=True)
+def __init_subclass__(cls:abase, **kwargs):
+    """Register all agent classes as pytrees."""
+    jax.tree_util.register_pytree_node_class(cls)
+
+jax.tree_util.register_pytree_node_class(abase)
+# static attributes, which do not require a recompilation when they change
+abase._uncompared = ('env', 'has_last_statdist', 'has_last_obsdist')
@@ -11,10 +11,7 @@ import numpy as np
 import itertools as it
 
 import jax.numpy as jnp
-from jax import grad, jit, vmap
-from functools import partial
-
-from fastcore.utils import *
+from jax import jit
 
 from .Base import abase
 from ..Utils.Helpers import *
@@ -36,6 +33,10 @@ class aPObase(abase):
                  DiscountFactors,
                  use_prefactor=False,
                  opteinsum=True,
+                 use_omega=True,
+                 value_solver='inv',
+                 value_tolerance=1e-6,
+                 statdist_solver='eig',
                  **kwargs):
         """
         Parameters
@@ -45,6 +46,10 @@ class aPObase(abase):
         DiscountFactors : the agents' discount factors
         use_prefactor : use the 1-DiscountFactor prefactor (default: False)
         opteinsum : keyword argument to optimize einsum methods (default: True)
+        use_omega : use the other agents' actions summation tensor (default: True)
+        value_solver : 'inv', 'solve', 'neumann' or 'gmres' (default: 'inv')
+        value_tolerance : tolerance of iterative value solvers (default: 1e-6)
+        statdist_solver : 'eig', 'solve' or 'power' (default: 'eig')
         """
         R = jnp.array(RewardTensor)
         T = jnp.array(TransitionTensor)
@@ -80,9 +85,15 @@ class aPObase(abase):
         # use (1-DiscountFactor) prefactor to have values on scale of rewards
         self.pre = 1 - self.gamma if use_prefactor else np.ones(N)        
         self.use_prefactor = use_prefactor
+        # share the value computation when all discount factors are equal
+        self._shared_gamma = bool(np.all(self.gamma == self.gamma[0]))
+        # identical observation models give identical observation transitions
+        self._shared_O = bool(np.all(O == O[0]))
 
         # 'load' the other agents actions summation tensor for speed
-        self.Omega = self._OtherAgentsActionsSummationTensor()
+        self.use_omega = use_omega
+        self.Omega = self._OtherAgentsActionsSummationTensor()\
+            if use_omega else None
         
         # state and obs distribution helpers
         self.has_last_statdist = False
@@ -93,11 +104,22 @@ class aPObase(abase):
         # use optimized einsum method
         self.opti = opteinsum  
 
+        # how to solve for the values
+        assert value_solver in ['inv', 'solve', 'neumann', 'gmres'],\
+            f"Unknown value solver '{value_solver}'"
+        self.value_solver = value_solver
+        self.value_tolerance = value_tolerance
+
+        # how to compute stationary distributions
+        assert statdist_solver in ['eig', 'solve', 'power'],\
+            f"Unknown stationary distribution solver '{statdist_solver}'"
+        self.statdist_solver = statdist_solver
+
    
     # =========================================================================
     #   Strategy averaging
     # =========================================================================
-    @partial(jit, static_argnums=0)    
+    @jit    
     def Xisa(self, X):
         """
         Compute state-action policy given the current observation-action policy
@@ -109,7 +131,7 @@ class aPObase(abase):
         # assert np.allclose(Xisa.sum(-1), 1.0), 'Not a policy. Must not happen!'
         return Xisa
 
-    @partial(jit, static_argnums=0)
+    @jit
     def Tss(self, X):
         """Compute average transition model Tss given policy X"""
         Xisa = self.Xisa(X)
@@ -120,10 +142,10 @@ class aPObase(abase):
         Compute 'belief' that environment is in stats s given agent i
         observes observation o (Bayes Rule)
         """
-        pS = self.statedist(X)
+        pS = self.Ps(X)
         return self._bios(X, pS)
     
-    @partial(jit, static_argnums=0)
+    @jit
     def _bios(self, X, pS):
         i, s, o = 0, 1, 2 # variables 
 
@@ -135,7 +157,7 @@ class aPObase(abase):
         
         return Bios
         
-    @partial(jit, static_argnums=0)
+    @jit
     def fast_Bios(self, X):
         """
         Compute 'belief' that environment is in stats s given agent i
@@ -156,7 +178,7 @@ class aPObase(abase):
         
         return Bios
     
-    @partial(jit, static_argnums=0)    
+    @jit    
     def Tioo(self, X, Bios=None, Xisa=None):
         """Compute average transition model Tioo, given joint policy X"""
         # For speed up
@@ -167,6 +189,11 @@ class aPObase(abase):
         # agent i, state s, next state s_, observation o, next obs o', all acts
         i = 0; s = 1; s_ = 2; o = 3; o_ = 4; b2d = list(range(5, 5+self.N)) 
 
+        if not self.use_omega:  # average over one agent after the other
+            args = [Bios, [i, o, s], abase.Tss(self, Xisa), [s, s_],
+                    self.O, [i, s_, o_], [i, o, o_]]
+            return jnp.einsum(*args, optimize=self.opti)
+
         Y4einsum = list(it.chain(*zip(Xisa,
                                       [[s, b2d[a]] for a in range(self.N)])))
         
@@ -174,7 +201,7 @@ class aPObase(abase):
                 self.O, [i, s_, o_], [i, o, o_]]
         return jnp.einsum(*args, optimize=self.opti)
     
-    @partial(jit, static_argnums=0)    
+    @jit    
     def Tioao(self, X, Bios=None, Xisa=None):
         """Compute average transition model Tioao, given joint policy X"""
         # For speed up
@@ -184,19 +211,11 @@ class aPObase(abase):
         # Variables
         # agent i, act a, state s, next state s_, observation o, next obs o_
         i = 0; a = 1; s = 2; s_ = 3; o = 4; o_ = 5;
-        j2k = list(range(6, 6+self.N-1))  # other agents
-        b2d = list(range(6+self.N-1, 6+self.N-1 + self.N))  # all actions
-        e2f = list(range(5+2*self.N, 5+2*self.N + self.N-1))  # all other acts
-
-        sumsis = [[j2k[l], s, e2f[l]] for l in range(self.N-1)]  # sum inds
-        otherY = list(it.chain(*zip((self.N-1)*[Xisa], sumsis)))
-
-        args = [self.Omega, [i]+j2k+[a]+b2d+e2f,
-                Bios, [i, o, s]] + otherY + [self.T, [s]+b2d+[s_],
-                self.O, [i, s_, o_], [i, o, a, o_]]
-        return jnp.einsum(*args, optimize=self.opti)    
+        
+        args = [Bios, [i, o, s], self.O, [i, s_, o_]]
+        return self._OtherAgentsAverage(Xisa, args, [i, o, a, o_])
     
-    @partial(jit, static_argnums=0)    
+    @jit    
     def Rioa(self, X, Bios=None, Xisa=None):
         """Compute average reward Riosa, given joint policy X """
         # For speed up
@@ -204,22 +223,13 @@ class aPObase(abase):
         Xisa = self.Xisa(X) if Xisa is None else Xisa
         
         # Variables
-        # agent i, act a, state s, next state s_, observation o
-        i = 0; a = 1; s = 2; s_ = 3; o = 4
-        j2k = list(range(5, 5+self.N-1))  # other agents
-        b2d = list(range(5+self.N-1, 5+self.N-1 + self.N))  # all actions
-        e2f = list(range(4+2*self.N, 4+2*self.N + self.N-1))  # all other acts
- 
-        sumsis = [[j2k[l], s, e2f[l]] for l in range(self.N-1)]  # sum inds
-        otherY = list(it.chain(*zip((self.N-1)*[Xisa], sumsis)))
-
-        args = [self.Omega, [i]+j2k+[a]+b2d+e2f, Bios, [i, o, s]] +\
-                otherY + [self.T, [s]+b2d+[s_], self.R, [i, s]+b2d+[s_],
-                [i, o, a]]
+        # agent i, act a, state s, observation o
+        i = 0; a = 1; s = 2; o = 4
 
-        return jnp.einsum(*args, optimize=self.opti)
+        return self._OtherAgentsAverage(Xisa, [Bios, [i, o, s]], [i, o, a],
+                                        withR=True)
     
-    @partial(jit, static_argnums=0)        
+    @jit        
     def Rio(self, X, Bios=None, Xisa=None, Rioa=None):
         """Compute average reward Rio, given joint policy X"""       
         # For speed up
@@ -230,6 +240,10 @@ class aPObase(abase):
             # Variables
             # agent i, state s, next state s_, observation o,  # all actions
             i = 0; s = 1; s_ = 2; o = 3; b2d = list(range(4, 4+self.N)) 
+
+            if not self.use_omega:  # average over one agent after the other
+                args = [Bios, [i, o, s], abase.Ris(self, Xisa), [i, s], [i, o]]
+                return jnp.einsum(*args, optimize=self.opti)
             
             Y4einsum = list(it.chain(*zip(Xisa,
                                     [[s, b2d[a]] for a in range(self.N)])))
@@ -243,10 +257,10 @@ class aPObase(abase):
             args = [X, [i, o, a], Rioa, [i, o, a], [i, o]]
             return jnp.einsum(*args, optimize=self.opti)
 
-    @partial(jit, static_argnums=0)        
+    @jit        
     def Vio(self, X,
             Rio=None, Tioo=None, Bios=None, Xisa=None, Rioa=None,
-            gamma=None):
+            gamma=None, Vio0=None):
         """Compute average observation values Vio, given joint policy X"""
         gamma = self.gamma if gamma is None else gamma 
 
@@ -258,15 +272,10 @@ class aPObase(abase):
         Tioo = self.Tioo(X, Bios=Bios, Xisa=Xisa) if Tioo is None\
             else Tioo
         
-        i = 0; o = 1; op = 2  # Variables
-        n = np.newaxis
-        Mioo = np.eye(self.Q)[n,:,:] - gamma[:, n, n] * Tioo
-        invMioo = jnp.linalg.inv(Mioo)
+        shared = self._shared_O and self._shared_gamma and gamma is self.gamma
+        return self._SolveValues(Tioo, Rio, gamma, Vik0=Vio0, shared=shared)
 
-        return self.pre[:,n] * jnp.einsum(invMioo, [i, o, op], Rio, [i, op],
-                                          [i, o], optimize=self.opti)    
-
-    @partial(jit, static_argnums=0)            
+    @jit            
     def Qioa(self, X, Rioa=None, Vio=None, Tioao=None, Bios=None, Xisa=None,
              gamma=None):
         gamma = self.gamma if gamma is None else gamma 
@@ -287,15 +296,36 @@ class aPObase(abase):
     # =========================================================================
     #   HELPERS
     # =========================================================================
-    @partial(jit, static_argnums=0)            
     def Ri(self, X):
         """Compute average reward Ri, given joint policy X""" 
         i, o = 0, 1
         return jnp.einsum(self.obsdist(X), [i, o], self.Rio(X), [i, o], [i])
     
+    @jit            
+    def stationary_Ri(self, X, Dio0=None):
+        """
+        Compute average reward Ri, given joint policy X and last stationary
+        observation distribution Dio0. Returns (Ri, stationary distribution)
+        """
+        i, o = 0, 1
+        Dio = self.stationary_obsdist(X, Dio0)
+        return jnp.einsum(Dio, [i, o], self.Rio(X), [i, o], [i]), Dio
+
+    @jit  
+    def stationary_obsdist(self, X, Dio0=None):
+        """
+        Compute stationary observation distribution, given joint policy X and
+        last stationary observation distribution Dio0 (default: uniform)
+        """
+        Dio0 = jnp.ones((self.N, self.Q)) / self.Q if Dio0 is None else Dio0
+        return self._jobsdist(X, Dio0)
+    
     def obsdist(self, X):
         if self.has_last_obsdist:
             obsdist =  self._jobsdist(X, self._last_obsdist)
+        elif self.statdist_solver != 'eig':  # no need for the numpy version
+            obsdist = self.stationary_obsdist(X)
+            self.has_last_obsdist = True
         else:
             obsdist = jnp.array(self._obsdist(X))
             self.has_last_obsdist = True
@@ -303,10 +333,15 @@ class aPObase(abase):
         self._last_obsdist = obsdist
         return obsdist
 
-    @partial(jit, static_argnums=0)  
+    @jit  
     def _jobsdist(self, X, pO0, rndkey=42):
         """Compute stationary distribution, given joint policy X"""
         Tioo = self.Tioo(X)
+        if self.statdist_solver == 'solve':  # all agents at once
+            return solve_stationarydistribution(Tioo)
+        elif self.statdist_solver == 'power':
+            return power_stationarydistribution(Tioo, pO0)
+        
         Dio = jnp.zeros((self.N, self.Q))
         
         for i in range(self.N):
@@ -356,33 +391,33 @@ class aPObase(abase):
     # ======================================================
     #   Additional state based averages
     # =========================================================================
-    @partial(jit, static_argnums=0)  
+    @jit  
     def Tisas(self, X):
         """Compute average transition model Tisas, given joint policy X"""      
         Xisa = self.Xisa(X)
         return super().Tisas(Xisa)
 
-    @partial(jit, static_argnums=0)  
+    @jit  
     def Risa(self, X):
         """Compute average reward Risa, given joint policy X"""
         Xisa = self.Xisa(X)
         return super().Risa(Xisa)
 
-    @partial(jit, static_argnums=0)  
+    @jit  
     def Ris(self, X, Risa=None):
         """Compute average reward Ris, given joint policy X""" 
         Xisa = self.Xisa(X)
         return super().Ris(Xisa, Risa=Risa)
     
-    @partial(jit, static_argnums=0)  
-    def Vis(self, X, Ris=None, Tss=None, Risa=None):
+    @jit  
+    def Vis(self, X, Ris=None, Tss=None, Risa=None, Vis0=None):
         """Compute average state values Vis, given joint policy X"""
         Xisa = self.Xisa(X)
         Ris = self.Ris(X) if Ris is None else Ris
         Tss = self.Tss(X) if Tss is None else Tss
-        return super().Vis(Xisa, Ris=Ris, Tss=Tss, Risa=Risa)
+        return super().Vis(Xisa, Ris=Ris, Tss=Tss, Risa=Risa, Vis0=Vis0)
 
-    @partial(jit, static_argnums=0)  
+    @jit  
     def Qisa(self, X, Risa=None, Vis=None, Tisas=None):
         """Compute average state-action values Qisa, given joint policy X"""
         Xisa = self.Xisa(X)
@@ -390,4 +425,3 @@ class aPObase(abase):
         Vis = self.Vis(X) if Vis is None else Vis
         Tisas = self.Tisas(X) if Tisas is None else Tisas
         return super().Qisa(Xisa, Risa=Risa, Vis=Vis, Tisas=Tisas)
-
@@ -14,8 +14,6 @@ import numpy as np
 import itertools as it
 from functools import partial
 
-from fastcore.utils import *
-
 from .POStrategyBase import POstrategybase
 from ..Utils.Helpers import *
 
@@ -27,17 +25,17 @@ class POstratAC(POstrategybase):
     temporal-difference actor-critic reinforcement learning in policy space.
     """
     
-    @partial(jit, static_argnums=(0,2))
-    def RPEioa(self, X, norm=False):
+    @partial(jit, static_argnums=(2, 4))
+    def RPEioa(self, X, norm=False, Vio0=None, values=False):
         """
         TD error for partially observable policy AC dynamics,
-        given joint policy X
+        given joint policy X (and the values Vio, if `values`)
         """
         Bios = self.fast_Bios(X)  # for speed up
         Xisa = self.Xisa(X)  # for speed up
         
         R = self.Rioa(X, Bios=Bios, Xisa=Xisa)
-        Vio = self.Vio(X, Bios=Bios, Xisa=Xisa, Rioa=R)
+        Vio = self.Vio(X, Bios=Bios, Xisa=Xisa, Rioa=R, Vio0=Vio0)
         NextV = self.NextVioa(X, Bios=Bios, Xisa=Xisa, Vio=Vio)
 
         n = jnp.newaxis
@@ -45,9 +43,9 @@ class POstratAC(POstrategybase):
         E *= self.beta[:,n,n]
 
         E = E - E.mean(axis=2, keepdims=True) if norm else E
-        return E
+        return (E, Vio) if values else E
     
-    @partial(jit, static_argnums=0)
+    @jit
     def NextVioa(self, X, Xisa=None, Bios=None, Vio=None, 
                  Tioo=None, Rio=None, Rioa=None):       
         """
@@ -59,15 +57,6 @@ class POstratAC(POstrategybase):
             if Vio is None else Vio
         
         i = 0; a = 1; s = 2; s_ = 3; o = 4; o_ = 5  # next observatio 
-        j2k = list(range(6, 6+self.N-1))  # other agents
-        b2d = list(range(6+self.N-1, 6+self.N-1 + self.N))  # all actions
-        e2f = list(range(5+2*self.N, 5+2*self.N + self.N-1))  # all other acts
-
-        sumsis = [[j2k[l], s, e2f[l]] for l in range(self.N-1)]  # sum inds
-        otherY = list(it.chain(*zip((self.N-1)*[Xisa], sumsis)))
             
-        args = [self.Omega, [i]+j2k+[a]+b2d+e2f, Bios, [i, o, s]] + otherY +\
-               [self.T, [s]+b2d+[s_], self.O, [i, s_, o_], 
-                Vio, [i, o_], [i, o, a]]
-        return jnp.einsum(*args, optimize=self.opti)
-
+        args = [Bios, [i, o, s], self.O, [i, s_, o_], Vio, [i, o_]]
+        return self._OtherAgentsAverage(Xisa, args, [i, o, a])
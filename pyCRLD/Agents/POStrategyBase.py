@@ -12,7 +12,7 @@ import jax.numpy as jnp
 from jax import grad, jit, vmap
 from functools import partial
 
-from fastcore.utils import *
+from fastcore.basics import patch
 
 from .Base import abase
 from .POBase import aPObase
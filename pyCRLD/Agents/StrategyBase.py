@@ -7,17 +7,17 @@ __all__ = ['strategybase']
 
 # %% ../../nbs/Agents/10_AStrategyBase.ipynb 4
 import numpy as np
-import itertools as it
 from functools import partial
 
-# import jax
+import jax
 from jax import jit
 import jax.numpy as jnp
-from typing import Iterable
-from fastcore.utils import *
+from typing import Iterable, Union
+from fastcore.basics import patch
 
 from .Base import abase
 from ..Utils.Helpers import *
+from ..Utils.Stability import stability_analysis
 
 # %% ../../nbs/Agents/10_AStrategyBase.ipynb 5
 class strategybase(abase):
@@ -33,12 +33,19 @@ class strategybase(abase):
                  choice_intensities:Union[float, Iterable]=1.0, # agents' choice intensities
                  use_prefactor=False,  # use the 1-DiscountFactor prefactor
                  opteinsum=True,  # optimize einsum functions
+                 use_omega=True,  # use the other agents' actions summation tensor
+                 value_solver='inv',  # 'inv', 'solve', 'neumann' or 'gmres'
+                 value_tolerance=1e-6,  # tolerance of iterative value solvers
+                 statdist_solver='eig',  # 'eig', 'solve' or 'power'
                  **kwargs):
 
         self.env = env
         Tt = env.T; assert np.allclose(Tt.sum(-1), 1)
         Rt = env.R    
-        super().__init__(Tt, Rt, discount_factors, use_prefactor, opteinsum)
+        super().__init__(Tt, Rt, discount_factors, use_prefactor, opteinsum,
+                         use_omega, value_solver=value_solver,
+                         value_tolerance=value_tolerance,
+                         statdist_solver=statdist_solver)
         self.F = jnp.array(env.F)
 
         # learning rates
@@ -50,20 +57,26 @@ class strategybase(abase):
         
         self.TDerror = self.RPEisa
         
-    @partial(jit, static_argnums=0)
+    @jit
     def step(self,
-             Xisa  # Joint strategy
-            ) -> tuple:  # (Updated joint strategy, Prediction error)
+             Xisa,  # Joint strategy
+             V0=None  # Optional values of the last step to warm-start the value solver
+            ) -> tuple:  # (Updated joint strategy, Prediction error[, Values])
         """
         Performs a learning step along the reward-prediction/temporal-difference error
         in strategy space, given joint strategy `Xisa`.
+        
+        Given the values `V0` of the last step, the values of this step are
+        returned as well, to warm-start the next step.
         """
-        TDe = self.TDerror(Xisa)
+        TDe, V = (self.TDerror(Xisa), None) if V0 is None\
+            else self.TDerror(Xisa, False, V0, True)
         n = jnp.newaxis
         XexpaTDe = Xisa * jnp.exp(self.alpha[:,n,n] * TDe)
-        return XexpaTDe / XexpaTDe.sum(-1, keepdims=True), TDe
+        X_ = XexpaTDe / XexpaTDe.sum(-1, keepdims=True)
+        return (X_, TDe) if V0 is None else (X_, TDe, V)
     
-    @partial(jit, static_argnums=0)
+    @jit
     def reverse_step(self,
                     Xisa  # Joint strategy
                     ) -> tuple:  # (Updated joint strategy, Prediction error)
@@ -107,3 +120,109 @@ def id(self:strategybase
         + f"pre{self.use_prefactor}"
 
     return envid + agentsid
+
+# %% ../../nbs/Agents/10_AStrategyBase.ipynb 13
+def _logits2strategy(Y:jnp.ndarray  # Logits relative to the last action
+                    ) -> jnp.ndarray:  # Strategy
+    """Softmax strategy from the logits of all but the last action"""
+    Y = jnp.concatenate([Y, jnp.zeros(Y.shape[:-1] + (1,))], axis=-1)
+    return jax.nn.softmax(Y, axis=-1)
+
+@partial(jit, static_argnums=3)
+def _newton_fixedpoint(self:strategybase, Xinit, tolerance, maxiter):
+    """Damped Newton iteration for a fixed point of `step` near `Xinit`"""
+    self = self._differentiable()
+        
+    def residual(Y):
+        X = _logits2strategy(Y)
+        return (self.step(X)[0] - X)[..., :-1]
+    def logits(X):
+        X = jnp.clip(X, 1e-30)
+        return jnp.log(X[..., :-1]) - jnp.log(X[..., -1:])
+    def learn(Y):  # follow the learning dynamics for some steps
+        X = jax.lax.fori_loop(0, self._fixedpoint_learningsteps,
+                              lambda t, X: self.step(X)[0], _logits2strategy(Y))
+        return logits(X)
+    
+    Y = logits(Xinit)
+    D = Y.size
+    dampings = 0.5 ** jnp.arange(8)  # of the Newton step
+    
+    def cond(carry):
+        k, Y, r = carry
+        return jnp.logical_and(jnp.max(jnp.abs(r)) >= tolerance, k < maxiter)
+    
+    def body(carry):
+        k, Y, r = carry
+        J = jax.jacfwd(residual)(Y).reshape(D, D)
+        r = r.reshape(D)
+        # Levenberg-Marquardt regularized Newton step
+        A = jnp.concatenate([J, jnp.sum(r**2)**0.5 * jnp.eye(D)])
+        b = jnp.concatenate([-r, jnp.zeros(D)])
+        dY = jnp.linalg.lstsq(A, b)[0].reshape(Y.shape)
+        # line search
+        Ys = Y + jnp.einsum('k,...->k...', dampings, dY)
+        rs = jax.vmap(residual)(Ys)
+        norms = jnp.abs(rs).reshape(len(dampings), -1).max(-1)
+        best = jnp.argmin(norms)
+        # when Newton does not make progress, e.g., far from a fixed point,
+        # follow the learning dynamics instead
+        progress = norms[best] < 0.9 * jnp.max(jnp.abs(r))
+        Y = jax.lax.cond(progress, lambda: Ys[best], lambda: learn(Y))
+        return k+1, Y, residual(Y)
+    
+    k, Y, r = jax.lax.while_loop(cond, body, (0, Y, residual(Y)))
+    return _logits2strategy(Y), jnp.max(jnp.abs(r)) < tolerance, k
+strategybase._newton_fixedpoint = _newton_fixedpoint  # to be able to use the jit decorator
+strategybase._fixedpoint_learningsteps = 10  # when Newton makes no progress
+
+# %% ../../nbs/Agents/10_AStrategyBase.ipynb 14
+@patch
+def find_fixedpoint(self:strategybase,
+                    Xinit:jnp.ndarray,  # Initial joint strategy
+                    tolerance:float=1e-6,  # Maximal change of the strategies in one step
+                    maxiter:int=1000,  # Maximal number of Newton steps
+                    attracting:bool=True  # Accept attracting fixed points only?
+                   ) -> tuple:  # (Fixed point, converged?, Newton steps)
+    """
+    Find a fixed point of the learning `step` near `Xinit` with Newton's method.
+    
+    With `attracting`, a fixed point that is not an attractor is returned with
+    `converged=False`, such that one may restart from another point.
+    """
+    if self.result_cache is not None:
+        key = self._cache_key('fixedpoint', Xinit, tolerance=tolerance, 
+                              maxiter=maxiter, attracting=attracting)
+        result = self.result_cache.load(key)
+        if result is not None:
+            return result['X'], bool(result['converged']), int(result['steps'])
+    
+    X, converged, k = self._newton_fixedpoint(Xinit, tolerance, maxiter)
+    X, converged, k = np.array(X), bool(converged), int(k)
+    if attracting and converged:
+        converged = bool(self._attracting(X[np.newaxis])[0])
+    if self.result_cache is not None:
+        self.result_cache.save(key, X=X, converged=converged, steps=k)
+    return X, converged, k
+
+@patch
+def find_fixedpoints(self:strategybase,
+                     Xinits:jnp.ndarray,  # Batch of initial joint strategies
+                     tolerance:float=1e-6,  # Maximal change of the strategies in one step
+                     maxiter:int=1000,  # Maximal number of Newton steps
+                     attracting:bool=True  # Accept attracting fixed points only?
+                    ) -> tuple:  # (Fixed points, converged?, Newton steps)
+    """Find fixed points of the learning `step` near each of the `Xinits`."""
+    newton = jax.vmap(lambda X: self._newton_fixedpoint(X, tolerance, maxiter))
+    Xs, converged, k = newton(jnp.asarray(Xinits))
+    Xs, converged, k = np.array(Xs), np.array(converged), np.array(k)
+    if attracting and converged.any():
+        converged[converged] = self._attracting(Xs[converged])
+    return Xs, converged, k
+
+@patch
+def _attracting(self:strategybase,
+                Xs:np.ndarray  # Batch of fixed points
+               ) -> np.ndarray:  # Attracting?
+    """Are the fixed points `Xs` attractors of the learning dynamics?"""
+    return stability_analysis(self, Xs).unstable_dimension == 0
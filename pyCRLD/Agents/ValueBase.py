@@ -10,11 +10,11 @@ import numpy as np
 import itertools as it
 from functools import partial
 
-# import jax
+import jax
 from jax import jit
 import jax.numpy as jnp
-from typing import Iterable
-from fastcore.utils import *
+from typing import Iterable, Union
+from fastcore.basics import patch
 
 from .Base import abase
 from ..Utils.Helpers import *
@@ -50,7 +50,7 @@ class multiagent_epsilongreedy_strategy():
             jnp.array(epsilon_greedys).astype(float)
 
 # %% ../../nbs/Agents/10_AValueBase.ipynb 7
-@partial(jit, static_argnums=0)
+@jit
 def action_probabilities(self:multiagent_epsilongreedy_strategy, Qisa):
     """Transform Q values into epsilongreedy policy"""
     n = jnp.newaxis
@@ -76,6 +76,23 @@ multiagent_epsilongreedy_strategy.action_probabilities = action_probabilities
 
 # %% ../../nbs/Agents/10_AValueBase.ipynb 8
 @patch
+def tree_flatten(self:multiagent_epsilongreedy_strategy):
+    """Split the strategy function into array leaves and static data."""
+    return (self.epsilongreedy_explorations,), self.N
+
+@patch(cls_method=True)
+def tree_unflatten(cls:multiagent_epsilongreedy_strategy, N, leaves):
+    """Recreate the strategy function from static data and array leaves."""
+    self = object.__new__(cls)
+    self.N = N
+    self.epsilongreedy_explorations, = leaves
+    return self
+
+# to be a regular argument to jitted functions
+jax.tree_util.register_pytree_node_class(multiagent_epsilongreedy_strategy)
+
+# %% ../../nbs/Agents/10_AValueBase.ipynb 9
+@patch
 def id(self:multiagent_epsilongreedy_strategy
        ) -> str: # id 
     """Returns an identifier to handle simulation runs."""
@@ -86,7 +103,7 @@ def id(self:multiagent_epsilongreedy_strategy
     
     return id[:-1]     
 
-# %% ../../nbs/Agents/10_AValueBase.ipynb 10
+# %% ../../nbs/Agents/10_AValueBase.ipynb 11
 class valuebase(abase):
     """
     Base class for deterministic strategy-average independent (multi-agent) reward-prediction temporal-difference reinforcement learning in value space.
@@ -100,12 +117,19 @@ class valuebase(abase):
                  choice_intensities:Union[float, Iterable]=1.0, # agents' choice intensities
                  use_prefactor=False,  # use the 1-DiscountFactor prefactor
                  opteinsum=True,  # optimize einsum functions
+                 use_omega=True,  # use the other agents' actions summation tensor
+                 value_solver='inv',  # 'inv', 'solve', 'neumann' or 'gmres'
+                 value_tolerance=1e-6,  # tolerance of iterative value solvers
+                 statdist_solver='eig',  # 'eig', 'solve' or 'power'
                  **kwargs):
 
         self.env = env
         Tt = env.T; assert np.allclose(Tt.sum(-1), 1)
         Rt = env.R    
-        super().__init__(Tt, Rt, discount_factors, use_prefactor, opteinsum)
+        super().__init__(Tt, Rt, discount_factors, use_prefactor, opteinsum,
+                         use_omega, value_solver=value_solver,
+                         value_tolerance=value_tolerance,
+                         statdist_solver=statdist_solver)
         self.F = jnp.array(env.F)
 
         # learning rates
@@ -120,20 +144,25 @@ class valuebase(abase):
         # temporal difference error mirror (without indices)
         self.TDerror = self.RPEisa      
 
-# %% ../../nbs/Agents/10_AValueBase.ipynb 11
-@partial(jit, static_argnums=0)
+# %% ../../nbs/Agents/10_AValueBase.ipynb 12
+@jit
 def step(self:valuebase, 
-         Qisa):  # joint state-action values
+         Qisa,  # joint state-action values
+         V0=None):  # Optional values of the last step to warm-start the value solver
     """
     Temporal-difference reward-prediction learning step in value space,
     given joint state-action values `Qisa`.
+    
+    Given the values `V0` of the last step, the values of this step are
+    returned as well, to warm-start the next step.
     """
-    RPisa = self.TDerror(Qisa)
+    RPisa, V = (self.TDerror(Qisa), None) if V0 is None\
+        else self.TDerror(Qisa, False, V0, True)
     Qisa_ = Qisa + self.alpha * RPisa
-    return Qisa_, RPisa
+    return (Qisa_, RPisa) if V0 is None else (Qisa_, RPisa, V)
 valuebase.step = step  # Monkey-patching - possibly problematic, but allows seperating the function definition from the class definition into different cells
 
-# %% ../../nbs/Agents/10_AValueBase.ipynb 12
+# %% ../../nbs/Agents/10_AValueBase.ipynb 13
 @patch
 def zero_intelligence_values(self:valuebase,
                              value:float=0.0): # state-action value
@@ -146,13 +175,13 @@ def zero_intelligence_values(self:valuebase,
     """
     return value * jnp.ones((self.N, self.Z, self.M))
 
-# %% ../../nbs/Agents/10_AValueBase.ipynb 13
+# %% ../../nbs/Agents/10_AValueBase.ipynb 14
 @patch
 def random_values(self:valuebase):
     """Returns normally distributed random state-action values."""
     return jnp.array(np.random.randn(self.N, self.Z, self.M))
 
-# %% ../../nbs/Agents/10_AValueBase.ipynb 14
+# %% ../../nbs/Agents/10_AValueBase.ipynb 15
 def id(self:valuebase
        ) -> str: # id 
     """Returns an identifier to handle simulation runs."""
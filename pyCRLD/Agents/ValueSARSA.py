@@ -14,8 +14,6 @@ import jax
 from jax import jit
 import jax.numpy as jnp
 
-from fastcore.utils import *
-
 from .ValueBase import valuebase
 from ..Utils.Helpers import *
 
@@ -26,27 +24,32 @@ class valSARSA(valuebase):
     """
 
 # %% ../../nbs/Agents/05_AValueSARSA.ipynb 21
-@partial(jit, static_argnums=(0,2))
+@partial(jit, static_argnums=(2, 4))
 def RPEisa(self:valSARSA,
            Qisa,  # Joint strategy
-           norm=False # normalize error around actions? 
-           ) -> np.ndarray:  # reward-prediction error
+           norm=False, # normalize error around actions? 
+           Vis0=None,  # Optional initial guess for iterative value solvers
+           values=False  # also return the values `Vis`?
+           ) -> np.ndarray:  # reward-prediction error (and values)
     """
     Compute temporal-difference reward-prediction error for 
     value SARSA dynamics, given joint state-action values `Qisa`.
     """
-    Risa = self.valRisa(Qisa)
-    NextQisa = self.value_NextQisa(Qisa)
+    Xisa = self.strategy_function.action_probabilities(Qisa)
+    ev = self.evaluate(Xisa, Vis0=Vis0)
+    Risa = ev.Risa
+    NextQisa = self.value_NextQisa(Qisa, Xisa=Xisa, valQisa=ev.Qisa,
+                                   Tisas=ev.Tisas)
     
     n = jnp.newaxis
     E = self.pre[:,n,n]*Risa + self.gamma[:,n,n]*NextQisa - Qisa
     
     E = E - E.mean(axis=2, keepdims=True) if norm else E
-    return E
+    return (E, ev.Vis) if values else E
 valSARSA.RPEisa = RPEisa
 
 # %% ../../nbs/Agents/05_AValueSARSA.ipynb 22
-@partial(jit, static_argnums=0)
+@jit
 def valRisa(self:valSARSA, 
             Qisa): # Joint state-action values
     """ Average reward Risa, given joint state-action values `Qisa` """
@@ -56,30 +59,28 @@ def valRisa(self:valSARSA,
 valSARSA.valRisa = valRisa
 
 # %% ../../nbs/Agents/05_AValueSARSA.ipynb 23
-@partial(jit, static_argnums=0)
+@jit
 def valNextQisa(self:valSARSA, 
-                Qisa):   
+                Qisa,  # Joint state-action values
+                Xisa=None,  # Optional joint strategy for speed-up
+                valQisa=None,  # Optional true state-action values for speed-up
+                Tisas=None):  # Optional transition for speed-up
     """
     Compute strategy-average next state-action value for agent `i`, current
     state `s` and action `a`, given joint state-action values `Qisa`.
     """
-    Xisa = self.strategy_function.action_probabilities(Qisa)
-    valQisa = self.Qisa(Xisa)  # true state-action values given current Qisa
+    Xisa = self.strategy_function.action_probabilities(Qisa)\
+        if Xisa is None else Xisa
+    # true state-action values given current Qisa
+    Tisas = self.Tisas(Xisa) if Tisas is None else Tisas
+    valQisa = self.Qisa(Xisa, Tisas=Tisas) if valQisa is None else valQisa
 
     i = 0  # agent i
     a = 1  # its action a
     s = 2  # the current state
     sprim = 3  # the next state
-    j2k = list(range(4, 4+self.N-1))  # other agents
-    b2d = list(range(4+self.N-1, 4+self.N-1 + self.N))  # all actions
-    e2f = list(range(3+2*self.N, 3+2*self.N + self.N-1))  # all other acts
-
-    sumsis = [[j2k[l], s, e2f[l]] for l in range(self.N-1)]  # sum inds
-    otherX = list(it.chain(*zip((self.N-1)*[Xisa], sumsis)))
         
     NextQisa = jnp.einsum(valQisa, [i, s, a], Xisa, [i, s, a], [i, s])
-                
-    args = [self.Omega, [i]+j2k+[a]+b2d+e2f] + otherX +\
-        [self.T, [s]+b2d+[sprim], NextQisa, [i, sprim], [i, s, a]]
-    return jnp.einsum(*args, optimize=self.opti)
+    return jnp.einsum(Tisas, [i, s, a, sprim], NextQisa, [i, sprim], [i, s, a],
+                      optimize=self.opti)
 valSARSA.value_NextQisa = valNextQisa  
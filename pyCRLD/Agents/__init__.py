@@ -0,0 +1,9 @@
+"""Multi-agent learners, imported on first access of their class."""
+from .. import _lazy_package
+
+_modules = {'abase': 'Base', 'aPObase': 'POBase',
+            'strategybase': 'StrategyBase', 'POstrategybase': 'POStrategyBase',
+            'stratAC': 'StrategyActorCritic', 'POstratAC': 'POStrategyActorCritic',
+            'stratSARSA': 'StrategySARSA',
+            'valuebase': 'ValueBase', 'valSARSA': 'ValueSARSA'}
+__all__ = _lazy_package(__name__, _modules)
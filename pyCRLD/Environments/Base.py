@@ -6,7 +6,8 @@
 __all__ = ['ebase']
 
 # %% ../../nbs/Environments/00_EnvBase.ipynb 4
-from fastcore.utils import *
+from typing import Iterable
+from fastcore.basics import patch
 import numpy as np
 
 # %% ../../nbs/Environments/00_EnvBase.ipynb 5
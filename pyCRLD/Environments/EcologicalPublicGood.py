@@ -9,10 +9,9 @@ __all__ = ['EcologicalPublicGood']
 from .Base import ebase
 from ..Utils.Helpers import make_variable_vector
 
-from fastcore.utils import *
-from fastcore.test import *
+from fastcore.basics import patch
 
-from typing import Iterable
+from typing import Iterable, Union
 import numpy as np
 
 # %% ../../nbs/Environments/11_EnvEcologicalPublicGood.ipynb 14
@@ -9,8 +9,7 @@ __all__ = ['StateActHistsIx', 'hSset', 'histSjA_TransitionTensor', 'histSjA_Rewa
 # %% ../../nbs/Environments/01_EnvHistoryEmbedding.ipynb 28
 import numpy as np
 import itertools as it
-from fastcore.utils import *
-from fastcore.test import *
+from typing import Iterable
 
 from .Base import ebase
 
@@ -9,12 +9,10 @@ __all__ = ['RenewableRessources']
 from .Base import ebase
 from ..Utils.Helpers import make_variable_vector
 
-from fastcore.utils import *
-from fastcore.test import *
+from fastcore.basics import patch
 
 from typing import Iterable
 import numpy as np
-from scipy.stats import norm
 
 # %% ../../nbs/Environments/13_EnvRenewableRessources.ipynb 7
 class RenewableRessources(ebase):
@@ -130,6 +128,7 @@ def _transition_probability(self:RenewableRessources, s, jA, sprim):
     #     p = 0
         
     # gaussian distribution with std `sig` around new_stock
+    from scipy.stats import norm  # imported here, as scipy.stats is slow to import
     sig = self.sig
     
     if sprim == 0:  # minimum 
@@ -222,8 +221,3 @@ def id(self:RenewableRessources):
         f"{self.N}_{str(r)}_{str(C)}"
 
     return id
-
-# %% ../../nbs/Environments/13_EnvRenewableRessources.ipynb 26
-from .RenewableRessources import RenewableRessources
-from ..Agents.POStrategyActorCritic import POstratAC
-import numpy as np
@@ -8,8 +8,7 @@ __all__ = ['SocialDilemma']
 # %% ../../nbs/Environments/10_EnvSocialDilemma.ipynb 5
 from .Base import ebase
 
-from fastcore.utils import *
-from fastcore.test import *
+from fastcore.basics import patch
 
 import numpy as np
 
@@ -9,8 +9,7 @@ __all__ = ['UncertainSocialDilemma']
 from .Base import ebase
 from ..Utils.Helpers import make_variable_vector
 
-from fastcore.utils import *
-from fastcore.test import *
+from fastcore.basics import patch
 
 from typing import Iterable
 import numpy as np
@@ -0,0 +1,7 @@
+"""Environments, imported on first access of their class or module."""
+from .. import _lazy_package
+
+# the other environments are named like their modules, e.g., `SocialDilemma`,
+# which are imported on first access: `Environments.SocialDilemma.SocialDilemma`
+_modules = {'ebase': 'Base', 'HistoryEmbedded': 'HistoryEmbedding'}
+__all__ = _lazy_package(__name__, _modules)
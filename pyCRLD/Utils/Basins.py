@@ -0,0 +1,165 @@
+"""Map the basins of attraction of the learning dynamics"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/Utils/03_UBasins.ipynb.
+
+# %% auto 0
+__all__ = ['grid_strategies', 'lhs_strategies', 'Basins', 'basins_of_attraction']
+
+# %% ../../nbs/Utils/03_UBasins.ipynb 4
+import itertools as it
+from typing import Iterable, NamedTuple
+from functools import partial
+
+import jax
+import numpy as np
+import jax.numpy as jnp
+from jax import jit
+
+# %% ../../nbs/Utils/03_UBasins.ipynb 6
+def grid_strategies(mae,  # CRLD multi-agent object
+                    coordinates:Iterable[tuple],  # (agent, state, action) indices to vary
+                    points:Iterable[float],  # values of each coordinate on the grid
+                    Xbase:np.ndarray=None  # strategy for all other coordinates
+                   ) -> np.ndarray:  # joint strategies [p, i, s, a]
+    """
+    Joint strategies on a regular grid along 2 or 3 `coordinates`. 
+    The other actions of a varied agent and state share the remaining 
+    probability in proportion to `Xbase`, which defaults to uniform strategies.
+    """
+    Q = mae.Q if hasattr(mae, 'Q') else mae.Z  # number of conditions
+    Xbase = np.ones((mae.N, Q, mae.M)) / mae.M if Xbase is None\
+        else np.array(Xbase, dtype=float)
+    points = np.asarray(points, dtype=float)
+    
+    Xs = []
+    for values in it.product(points, repeat=len(coordinates)):
+        X = Xbase.copy()
+        for (i, s, a), value in zip(coordinates, values):
+            others = np.arange(mae.M) != a
+            X[i, s, others] *= (1 - value) / X[i, s, others].sum()
+            X[i, s, a] = value
+        Xs.append(X)
+    return np.array(Xs)
+
+# %% ../../nbs/Utils/03_UBasins.ipynb 8
+def lhs_strategies(mae,  # CRLD multi-agent object
+                   samples:int  # number of joint strategies
+                  ) -> np.ndarray:  # joint strategies [p, i, s, a]
+    """Joint strategies from Latin hypercube sampling."""
+    from pyDOE import lhs
+    
+    Q = mae.Q if hasattr(mae, 'Q') else mae.Z  # number of conditions
+    Xs = lhs(mae.N*Q*mae.M, samples).reshape(samples, mae.N, Q, mae.M)
+    return Xs / Xs.sum(axis=-1, keepdims=True)
+
+# %% ../../nbs/Utils/03_UBasins.ipynb 10
+class Basins(NamedTuple):
+    """Basins of attraction of a set of initial strategies."""
+    labels: np.ndarray  # attractor of each initial strategy, -1 if none was reached [p]
+    sizes: np.ndarray  # number of initial strategies in each basin [k]
+    attractors: np.ndarray  # joint strategies of the attractors [k, i, s, a]
+    steps: np.ndarray  # number of learning steps of each initial strategy [p]
+
+# %% ../../nbs/Utils/03_UBasins.ipynb 11
+def _distances(X:jnp.ndarray,  # batch of joint strategies [b, i, s, a]
+               attractors:jnp.ndarray  # known attractors, inf if unused [k, i, s, a]
+              ) -> jnp.ndarray:  # maximal absolute differences [b, k]
+    """Distances between joint strategies and attractors"""
+    d = jnp.abs(X[:, jnp.newaxis] - attractors[jnp.newaxis])
+    return d.reshape(X.shape[0], attractors.shape[0], -1).max(-1)
+
+@partial(jit, static_argnums=5)
+def _basins_segment(agents, X, done, failed, steps, T, attractors, 
+                    tolerance, radius):
+    """
+    Advance the batch of joint strategies `X` for `T` steps at most. Members 
+    stop when they converge or come within `radius` of a known attractor.
+    """
+    B = X.shape[0]  # batch size
+    n = (slice(None),) + (np.newaxis,)*(X.ndim-1)  # to broadcast masks
+    vstep = jax.vmap(agents.step)
+
+    def cond(carry):
+        t, X, done, failed, steps = carry
+        return jnp.logical_and(~jnp.all(done), t < T)
+
+    def body(carry):
+        t, X, done, failed, steps = carry
+        X_, TDe = vstep(X)
+        isnan = jnp.any(jnp.isnan(X_.reshape(B, -1)), axis=-1)
+        converged = jnp.linalg.norm((X_ - X).reshape(B, -1), axis=-1)\
+            < tolerance
+        
+        active = ~done
+        steps = steps + active
+        failed = failed | (active & isnan)
+        X = jnp.where((active & ~isnan)[n], X_, X)
+        near = _distances(X, attractors).min(-1) < radius
+        done = done | isnan | converged | near
+        return t+1, X, done, failed, steps
+
+    carry = (jnp.array(0), X, done, failed, steps)
+    t, X, done, failed, steps = jax.lax.while_loop(cond, body, carry)
+    d = _distances(X, attractors)
+    labels = jnp.where(d.min(-1) < radius, d.argmin(-1), -1)
+    return X, done, failed, steps, labels, t
+
+# %% ../../nbs/Utils/03_UBasins.ipynb 12
+def basins_of_attraction(mae,  # CRLD multi-agent object
+                         Xinits:np.ndarray,  # initial joint strategies [p, i, s, a]
+                         Tmax:int=10000,  # the maximum number of iteration steps
+                         tolerance:float=1e-5,  # to determine if a fix point is reached
+                         radius:float=0.01,  # to assign a strategy to an attractor
+                         attractors:np.ndarray=None,  # known attractors [k, i, s, a]
+                         segment:int=100  # number of steps between deduplications
+                        ) -> Basins:
+    """
+    Assign each of the initial joint strategies `Xinits` to the attractor
+    the learning dynamics converge to.
+    """
+    X = np.array(jnp.asarray(Xinits))
+    B = X.shape[0]
+    known = np.full((16,) + X.shape[1:], np.inf, dtype=X.dtype)
+    K = 0  # number of known attractors
+    
+    def assign(Xend):  # to a known or a new attractor
+        nonlocal known, K
+        if K > 0:
+            d = np.abs(known[:K] - Xend).reshape(K, -1).max(-1)
+            if d.min() < radius:
+                return int(d.argmin())
+        if K == len(known):  # make room for more attractors
+            known = np.concatenate([known, np.full_like(known, np.inf)])
+        known[K] = Xend
+        K += 1
+        return K - 1
+    
+    for Xa in ([] if attractors is None else attractors):
+        assign(np.asarray(Xa))
+    
+    done, failed = np.zeros(B, bool), np.zeros(B, bool)
+    steps, labels = np.zeros(B, int), np.full(B, -1)
+    t = 0
+    while t < Tmax and not np.all(done):
+        # advance only the active members, padded to a power of two 
+        # to limit the number of compilations
+        active = np.flatnonzero(~done)
+        A = len(active)
+        ix = np.concatenate([active, np.repeat(active[:1], 2**(A-1).bit_length() - A)])
+        pad = np.arange(len(ix)) >= A
+        
+        Xa, donea, faileda, stepsa, labelsa, dt = _basins_segment(
+            mae, X[ix], pad, failed[ix], steps[ix], min(segment, Tmax - t), 
+            jnp.array(known), tolerance, radius)
+        t += int(dt)
+        X[active] = np.array(Xa)[:A]
+        done[active], failed[active] = np.array(donea)[:A], np.array(faileda)[:A]
+        steps[active], labels[active] = np.array(stepsa)[:A], np.array(labelsa)[:A]
+        
+        # converged members not close to a known attractor
+        new = np.flatnonzero(done & ~failed & (labels < 0))
+        labels[new] = [assign(X[b]) for b in new]
+    
+    labels[~done | failed] = -1
+    sizes = np.bincount(labels[labels >= 0], minlength=K)
+    return Basins(labels, sizes, known[:K], steps)
@@ -0,0 +1,223 @@
+"""Measure the performance of the agents' core computations"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/Utils/04_UBenchmarks.ipynb.
+
+# %% auto 0
+__all__ = ['quantities', 'po_quantities', 'heavy_dependencies', 'RandomEnvironment', 'benchmark_environments', 'benchmark',
+           'run_benchmarks', 'compare_benchmarks', 'import_times']
+
+# %% ../../nbs/Utils/04_UBenchmarks.ipynb 4
+import sys
+import json
+import time
+import platform
+import subprocess
+import itertools as it
+from typing import Iterable, Union
+
+import jax
+import numpy as np
+
+import pyCRLD
+from ..Environments.Base import ebase
+from ..Environments.SocialDilemma import SocialDilemma
+from ..Environments.EcologicalPublicGood import EcologicalPublicGood
+from ..Environments.UncertainSocialDilemma import UncertainSocialDilemma
+from ..Environments.HistoryEmbedding import HistoryEmbedded
+from ..Agents.StrategyActorCritic import stratAC
+from ..Agents.POStrategyActorCritic import POstratAC
+
+# %% ../../nbs/Utils/04_UBenchmarks.ipynb 6
+class RandomEnvironment(ebase):
+    """Environment with random transitions and rewards of any size."""
+    
+    def __init__(self, 
+                 N:int,  # number of agents
+                 M:int,  # number of actions
+                 Z:int,  # number of states
+                 seed:int=0):  # of the random number generator
+        self.N, self.M, self.Z, self.seed = N, M, Z, seed
+        self.rng = np.random.default_rng(seed)
+        super().__init__()
+        
+    def TransitionTensor(self):
+        """Random transition probabilities"""
+        return self.rng.dirichlet(np.ones(self.Z), size=(self.Z,) + (self.M,)*self.N)
+    
+    def RewardTensor(self):
+        """Standard normal rewards"""
+        return self.rng.standard_normal((self.N, self.Z) + (self.M,)*self.N + (self.Z,))
+    
+    def id(self):
+        return f"{self.__class__.__name__}_N{self.N}_M{self.M}_Z{self.Z}_s{self.seed}"
+
+# %% ../../nbs/Utils/04_UBenchmarks.ipynb 8
+def benchmark_environments(Ns:Iterable[int]=(2, 3, 4),  # numbers of agents
+                           Ms:Iterable[int]=(2, 3),  # numbers of actions
+                           Zs:Iterable[int]=(1, 4, 16),  # numbers of states
+                           histories:Iterable[tuple]=((1, 1, 1), (1, 2, 2))  # of the embeddings
+                          ) -> list:  # of environments
+    """
+    Bundled environments, their history-embedded versions and random 
+    environments for all combinations of `Ns`, `Ms` and `Zs`.
+    """
+    socdi = SocialDilemma(R=1.0, T=1.2, S=-0.5, P=0.0)
+    envs = [socdi,
+            UncertainSocialDilemma(R1=5, T1=6, S1=-1, P1=0, R2=5, T2=2, S2=0,
+                                   P2=1, pC=0.5, obsnoise=0.2)]
+    envs += [EcologicalPublicGood(N=N, f=1.2, c=5, m=-5, qc=0.2, qr=0.01)
+             for N in Ns]
+    envs += [HistoryEmbedded(socdi, h=h) for h in histories]
+    envs += [RandomEnvironment(N, M, Z) for N, M, Z in it.product(Ns, Ms, Zs)]
+    return envs
+
+# %% ../../nbs/Utils/04_UBenchmarks.ipynb 10
+quantities = {  # of fully observant agents
+    'Tss': lambda mae, X: mae.Tss(X),
+    'Tisas': lambda mae, X: mae.Tisas(X),
+    'Ris': lambda mae, X: mae.Ris(X),
+    'Risa': lambda mae, X: mae.Risa(X),
+    'Vis': lambda mae, X: mae.Vis(X),
+    'Qisa': lambda mae, X: mae.Qisa(X),
+    'RPEisa': lambda mae, X: mae.RPEisa(X),
+    'step': lambda mae, X: mae.step(X),
+    'Ps': lambda mae, X: mae.stationary_Ps(X),
+}
+
+po_quantities = {  # of partially observant agents
+    'Xisa': lambda mae, X: mae.Xisa(X),
+    'Bios': lambda mae, X: mae._bios(X, mae.stationary_Ps(X)),
+    'Tioo': lambda mae, X: mae.Tioo(X),
+    'Tioao': lambda mae, X: mae.Tioao(X),
+    'Rioa': lambda mae, X: mae.Rioa(X),
+    'Vio': lambda mae, X: mae.Vio(X),
+    'RPEioa': lambda mae, X: mae.RPEioa(X),
+    'step': lambda mae, X: mae.step(X),
+}
+
+# %% ../../nbs/Utils/04_UBenchmarks.ipynb 12
+def benchmark(mae,  # CRLD multi-agent object
+              quantity:callable,  # computes a quantity, given `mae` and a strategy
+              X:np.ndarray,  # strategy to compute the quantity for
+              repeat:int=10  # number of timed executions
+             ) -> dict:  # measurements
+    """
+    Compile time, median run time and peak memory of a `quantity`.
+    """
+    tic = time.perf_counter()
+    compiled = jax.jit(quantity).lower(mae, X).compile()
+    compile_time = time.perf_counter() - tic
+    
+    jax.block_until_ready(compiled(mae, X))  # warm up
+    times = []
+    for _ in range(repeat):
+        tic = time.perf_counter()
+        jax.block_until_ready(compiled(mae, X))
+        times.append(time.perf_counter() - tic)
+    
+    memory = compiled.memory_analysis()
+    peak = None if memory is None else memory.argument_size_in_bytes\
+        + memory.output_size_in_bytes + memory.temp_size_in_bytes\
+        - memory.alias_size_in_bytes
+    return dict(compile_time=compile_time, run_time=float(np.median(times)),
+                peak_memory=peak)
+
+# %% ../../nbs/Utils/04_UBenchmarks.ipynb 14
+def run_benchmarks(envs:Iterable=None,  # defaults to `benchmark_environments()`
+                   repeat:int=10,  # number of timed executions
+                   filename:str=None,  # JSON file to store the results in
+                   verbose:bool=False  # print the results?
+                  ) -> dict:  # machine information and results
+    """
+    Benchmark all quantities of fully and partially observant actor-critic 
+    agents on all `envs`.
+    """
+    envs = benchmark_environments() if envs is None else envs
+    results = []
+    for env in envs:
+        for agents, qs in [(stratAC, quantities), (POstratAC, po_quantities)]:
+            mae = agents(env=env, learning_rates=0.1, discount_factors=0.9)
+            X = mae.random_softmax_strategy()
+            for name, quantity in qs.items():
+                result = dict(environment=env.id(), agents=agents.__name__, 
+                              quantity=name, N=mae.N, M=mae.M, Z=mae.Z,
+                              Q=getattr(mae, 'Q', mae.Z))
+                result.update(benchmark(mae, quantity, X, repeat=repeat))
+                results.append(result)
+                if verbose:
+                    print(f"{result['environment']:40} {result['agents']:10} {name:7}"
+                          f"  compile {result['compile_time']*1e3:8.1f} ms"
+                          f"  run {result['run_time']*1e6:10.1f} µs")
+    
+    info = dict(pyCRLD=pyCRLD.__version__, jax=jax.__version__, 
+                numpy=np.__version__, python=platform.python_version(),
+                machine=platform.machine(), processor=platform.processor(),
+                devices=[str(d) for d in jax.devices()], 
+                time=time.strftime('%Y-%m-%d %H:%M:%S'))
+    benchmarks = dict(info=info, results=results)
+    if filename is not None:
+        with open(filename, 'w') as f:
+            json.dump(benchmarks, f, indent=1)
+    return benchmarks
+
+# %% ../../nbs/Utils/04_UBenchmarks.ipynb 15
+def compare_benchmarks(benchmarks:dict,  # as returned by `run_benchmarks`
+                       baseline:Union[dict, str],  # results or JSON file to compare against
+                       measure:str='run_time',  # 'compile_time', 'run_time' or 'peak_memory'
+                       threshold:float=1.2  # ratio above which a result is a regression
+                      ) -> list:  # of (environment, agents, quantity, ratio, regression?)
+    """
+    Ratios of the `measure` between the `benchmarks` and the `baseline`.
+    """
+    if isinstance(baseline, str):
+        with open(baseline) as f:
+            baseline = json.load(f)
+    key = lambda r: (r['environment'], r['agents'], r['quantity'])
+    base = {key(r): r for r in baseline['results']}
+    
+    comparison = []
+    for r in benchmarks['results']:
+        b = base.get(key(r))
+        if b is None or not b[measure] or r[measure] is None:
+            continue
+        ratio = r[measure] / b[measure]
+        comparison.append(key(r) + (ratio, ratio > threshold))
+    return comparison
+
+# %% ../../nbs/Utils/04_UBenchmarks.ipynb 23
+_import_script = """
+import sys, time, json
+tic = time.perf_counter()
+import {module}
+toc = time.perf_counter() - tic
+try:  # peak resident memory since the interpreter started, on Linux
+    with open('/proc/self/status') as f:
+        memory = [int(l.split()[1]) * 1024 for l in f if l.startswith('VmHWM')][0]
+except OSError:
+    memory = None
+print(json.dumps([toc, memory, [m for m in {dependencies} if m in sys.modules]]))
+"""
+
+heavy_dependencies = ('jax', 'scipy', 'matplotlib', 'pyDOE')
+
+# %% ../../nbs/Utils/04_UBenchmarks.ipynb 24
+def import_times(modules:Iterable[str]=('pyCRLD', 'pyCRLD.Environments.SocialDilemma',
+                                        'pyCRLD.Environments.RenewableRessources',
+                                        'pyCRLD.Agents.StrategyActorCritic',
+                                        'pyCRLD.Utils.FlowPlot'),  # to import
+                 repeat:int=5,  # number of fresh interpreters per module
+                 verbose:bool=False  # print the results?
+                ) -> dict:  # import time (median), peak memory and loaded dependencies
+    """Measure the cost of importing each of the `modules` in fresh interpreters."""
+    results = {}
+    for module in modules:
+        script = _import_script.format(module=module, dependencies=heavy_dependencies)
+        runs = sorted(json.loads(subprocess.run([sys.executable, '-c', script],
+                                                capture_output=True, text=True,
+                                                check=True).stdout)
+                      for _ in range(repeat))
+        toc, memory, loaded = runs[len(runs)//2]
+        results[module] = dict(import_time=toc, peak_memory=memory, loaded=loaded)
+        if verbose:
+            print(f"{module:40} {toc:6.3f} s {(memory or 0)/2**20:6.0f} MB  {', '.join(loaded)}")
+    return results
@@ -7,17 +7,12 @@ __all__ = ['plot_strategy_flow', 'plot_trajectories']
 
 # %% ../../nbs/Utils/01_UFlowPlot.ipynb 18
 import numpy as np
-import matplotlib as mpl
-import matplotlib.pyplot as plt
 import itertools as it
 
+from typing import Iterable, Union
 from collections.abc import Callable
 
-from pyDOE import lhs
-
-from fastcore.utils import *
-
-# %% ../../nbs/Utils/01_UFlowPlot.ipynb 19
+# %% ../../nbs/Utils/01_UFlowPlot.ipynb 20
 def plot_strategy_flow(mae,  # CRLD multi-agent environment object
                        x:tuple,  # which phase space axes to plot along x axes
                        y:tuple,  # which phase space axes to plot along y axes
@@ -72,7 +67,7 @@ def plot_strategy_flow(mae,  # CRLD multi-agent environment object
     return axes
 
 
-# %% ../../nbs/Utils/01_UFlowPlot.ipynb 20
+# %% ../../nbs/Utils/01_UFlowPlot.ipynb 21
 def plot_trajectories(Xtrajs:Iterable,  # Iterable of phase space trajectories 
                       x:tuple,  # which phase space axes to plot along x axes
                       y:tuple,  # which phase space axes to plot along y axes
@@ -127,7 +122,7 @@ def plot_trajectories(Xtrajs:Iterable,  # Iterable of phase space trajectories
             
     return axes
 
-# %% ../../nbs/Utils/01_UFlowPlot.ipynb 22
+# %% ../../nbs/Utils/01_UFlowPlot.ipynb 23
 def _checks_and_balances(x:tuple,  # which phase space axes to plot along x axes
                          y:tuple   # which phase space axes to plot along y axes
                          ) -> tuple: # (lengths for each dimension, index of dimension to iter, length of iter)
@@ -144,7 +139,7 @@ def _checks_and_balances(x:tuple,  # which phase space axes to plot along x axes
     lens = max(xlens)
     return xlens, amx, lens 
 
-# %% ../../nbs/Utils/01_UFlowPlot.ipynb 26
+# %% ../../nbs/Utils/01_UFlowPlot.ipynb 27
 def _prepare_axes(axes:Iterable,  # Axes to plot into
                   xlens:tuple  # Lengths for each dimension of `x` and `y`
                  ) -> Iterable:  # of matplotlib axes     
@@ -154,6 +149,7 @@ def _prepare_axes(axes:Iterable,  # Axes to plot into
     """
     lens = max(xlens)
     if axes is None:
+        import matplotlib.pyplot as plt
         fig, axes = plt.subplots(1, lens, figsize=(3.2*lens, 2.8))
         plt.subplots_adjust(wspace=0.4)
     if not hasattr(axes, '__iter__'):
@@ -162,21 +158,21 @@ def _prepare_axes(axes:Iterable,  # Axes to plot into
     
     return axes
 
-# %% ../../nbs/Utils/01_UFlowPlot.ipynb 29
+# %% ../../nbs/Utils/01_UFlowPlot.ipynb 30
 def _dXisa_s(Xisa_s:Iterable, # of joint strategies `Xisa`
             mae  # CRLD multi-agent environment object
             ) -> np.ndarray:  # joint strategy differences 
     """Compute `Xisa`(t-1)-`Xisa`(t) for all `Xisa_s`."""
     return np.array([mae.step(Xisa)[0] - Xisa for Xisa in Xisa_s])
 
-# %% ../../nbs/Utils/01_UFlowPlot.ipynb 33
+# %% ../../nbs/Utils/01_UFlowPlot.ipynb 34
 def _dTDerror_s(Xisa_s:Iterable, # of joint strategies `Xisa`
               mae  # CRLD multi-agent environment object
             ) -> np.ndarray:  # joint reward-prediction errors
     """Compute reward-prediction errors `TDerror_s` for Xs."""
     return np.array([mae.TDerror(Xisa, norm=True) for Xisa in Xisa_s])
 
-# %% ../../nbs/Utils/01_UFlowPlot.ipynb 36
+# %% ../../nbs/Utils/01_UFlowPlot.ipynb 37
 def _strategies(mae,  # CRLD multi-agent environment object
                 xinds:tuple,  # of indices of the phase space item to plot along the x axis
                 yinds:tuple,  # of indices of the phase space item to plot along the y axis
@@ -188,6 +184,8 @@ def _strategies(mae,  # CRLD multi-agent environment object
     Creates strategies (as a particular type of phase space item) for one ax plot point.
     All strategies have value `xval` at the `xinds` index and value `yval` at the `yinds`. 
     """   
+    from pyDOE import lhs
+    
     N, C, M = mae.N, mae.Q, mae.M  # Number of agents, conditions, actions
     # Xs = np.random.rand(NrRandom, N, C, M)  # random policies
     Xs = lhs(N*C*M, NrRandom).reshape(NrRandom, N, C, M)  # using latin hypercube sampling
@@ -207,7 +205,7 @@ def _strategies(mae,  # CRLD multi-agent environment object
     
     return Xs
 
-# %% ../../nbs/Utils/01_UFlowPlot.ipynb 43
+# %% ../../nbs/Utils/01_UFlowPlot.ipynb 44
 def _data_to_plot(mae,  # CRLD multi-agent environment object
                   flowarrow_points:Iterable,  # range & resolution of flow arrows 
                   xinds:tuple,  # of indices of the phase space object to plot along the x axis
@@ -237,7 +235,7 @@ def _data_to_plot(mae,  # CRLD multi-agent environment object
             
     return X, Y, dX, dY
 
-# %% ../../nbs/Utils/01_UFlowPlot.ipynb 50
+# %% ../../nbs/Utils/01_UFlowPlot.ipynb 51
 def _plot(dX:np.ndarray,  # differences in x dimension
           dY:np.ndarray,  # differences in y dimension
           X:np.ndarray,  # meshgrid in x dimension
@@ -253,6 +251,7 @@ def _plot(dX:np.ndarray,  # differences in x dimension
     Plots the flow for one condition into one axes
     """
     if ax is None:
+        import matplotlib.pyplot as plt
         _, ax = plt.subplots(1,1, figsize=(4,4))
         
     if kind == "streamplot":
@@ -288,7 +287,7 @@ def _plot(dX:np.ndarray,  # differences in x dimension
             ax.quiver(X, Y, *_scale(DX, DY, sf), color=col, **qkwargs)        
     return ax
 
-# %% ../../nbs/Utils/01_UFlowPlot.ipynb 52
+# %% ../../nbs/Utils/01_UFlowPlot.ipynb 53
 def _scale(x:float,   # x dimension 
            y:float,   # y dimension
            a:float    # scaling factor
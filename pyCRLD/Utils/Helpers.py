@@ -3,9 +3,15 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/Utils/99_UHelpers.ipynb.
 
 # %% auto 0
-__all__ = ['make_variable_vector', 'compute_stationarydistribution']
+__all__ = ['make_variable_vector', 'compute_stationarydistribution', 'solve_stationarydistribution',
+           'power_stationarydistribution', 'cache_directory', 'use_compilation_cache', 'save_atomically', 'append_rows',
+           'read_rows', 'ResultCache', 'TrajectoryWriter', 'use_host_devices', 'device_mesh', 'pad_batch']
 
 # %% ../../nbs/Utils/99_UHelpers.ipynb 3
+import os
+import hashlib
+import tempfile
+
 import jax
 import numpy as np
 import jax.numpy as jnp
@@ -47,3 +53,323 @@ def compute_stationarydistribution(Tkk:jnp.ndarray):  # Transition matrix
     dist = dist / dist.sum(axis=0, keepdims=True)
     
     return jnp.where(meivec==-42, -10, dist)
+
+# %% ../../nbs/Utils/99_UHelpers.ipynb 15
+@jit
+def solve_stationarydistribution(Tkk:jnp.ndarray  # Transition matrix [..., k, k']
+                                ) -> jnp.ndarray:  # Stationary distribution [..., k]
+    """Compute the unique stationary distribution for transition matrix `Tkk`."""
+    K = Tkk.shape[-1]
+    # replace one of the (linear dependent) balance equations by normalization
+    Akk = jnp.swapaxes(Tkk, -1, -2) - jnp.eye(K)
+    Akk = Akk.at[..., -1, :].set(1.0)
+    b = jnp.zeros(Tkk.shape[:-1]).at[..., -1].set(1.0)
+    return jnp.linalg.solve(Akk, b[..., None])[..., 0]
+
+# %% ../../nbs/Utils/99_UHelpers.ipynb 18
+@jit
+def power_stationarydistribution(Tkk:jnp.ndarray,  # Transition matrix [..., k, k']
+                                 p0:jnp.ndarray,  # Initial distribution [..., k]
+                                 tol:float=1e-8,  # Convergence tolerance
+                                 maxiter:int=10000  # Maximum number of iterations
+                                ) -> jnp.ndarray:  # Stationary distribution [..., k]
+    """Compute stationary distribution for `Tkk` with power iteration from `p0`."""
+    # lazy chain (T + I)/2 has the same stationary distributions, but no cycles
+    Tkk = 0.5 * (Tkk + jnp.eye(Tkk.shape[-1]))
+    
+    def cond(carry):
+        t, p, delta = carry
+        return jnp.logical_and(delta > tol, t < maxiter)
+    def body(carry):
+        t, p, delta = carry
+        p_ = jnp.einsum('...k,...kl->...l', p, Tkk)
+        return t+1, p_, jnp.max(jnp.abs(p_ - p))
+    
+    p0 = jnp.broadcast_to(p0, Tkk.shape[:-1])
+    _, p, _ = jax.lax.while_loop(cond, body, (0, p0, jnp.inf))
+    return p / p.sum(-1, keepdims=True)
+
+# %% ../../nbs/Utils/99_UHelpers.ipynb 23
+def cache_directory() -> str:  # Path of the cache directory
+    "Directory for on-disk caches, set by the `PYCRLD_CACHE` environment variable."
+    return os.environ.get('PYCRLD_CACHE',
+                          os.path.join(os.path.expanduser('~'), '.cache', 'pyCRLD'))
+
+# %% ../../nbs/Utils/99_UHelpers.ipynb 26
+def use_compilation_cache(directory:str=None  # defaults to `xla` in the `cache_directory()`
+                         ) -> str:  # Directory of the compilation cache
+    """
+    Store all compiled XLA executables on disk, such that later processes 
+    compiling the same computations load them instead.
+    """
+    directory = os.path.join(cache_directory(), 'xla') if directory is None\
+        else directory
+    jax.config.update('jax_compilation_cache_dir', directory)
+    jax.config.update('jax_persistent_cache_min_compile_time_secs', 0.0)
+    jax.config.update('jax_persistent_cache_min_entry_size_bytes', 0)
+    return directory
+
+# %% ../../nbs/Utils/99_UHelpers.ipynb 28
+def save_atomically(filename:str,  # Name of the file to write
+                    **arrays):  # Arrays to store
+    "Store `arrays` compressed in `filename`, without ever exposing a partial file."
+    directory = os.path.dirname(os.path.abspath(filename))
+    os.makedirs(directory, exist_ok=True)
+    
+    fd, tmpname = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.savez_compressed(f, **arrays)
+        os.replace(tmpname, filename)  # atomic on POSIX and Windows
+    except BaseException:
+        os.remove(tmpname)
+        raise
+
+# %% ../../nbs/Utils/99_UHelpers.ipynb 32
+def append_rows(filename:str,  # Name of the raw file
+                rows:np.ndarray,  # Rows to append, along the first axis
+                start:int):  # number of rows in the file to keep
+    "Write `rows` into the raw file `filename` after its first `start` rows."
+    rows = np.ascontiguousarray(rows)
+    rowbytes = rows.dtype.itemsize * int(np.prod(rows.shape[1:]))
+    with open(filename, 'r+b' if os.path.exists(filename) else 'wb') as f:
+        f.seek(start * rowbytes)
+        f.write(rows.tobytes())
+        f.truncate()
+
+def read_rows(filename:str,  # Name of the raw file
+              length:int,  # number of rows to read
+              dtype:np.dtype,  # of the rows
+              shape:tuple  # of a single row
+             ) -> np.ndarray:  # The first `length` rows
+    "Read the first `length` rows written to `filename` with `append_rows`."
+    count = length * int(np.prod(shape))
+    return np.fromfile(filename, dtype, count=count).reshape((length,) + tuple(shape))
+
+# %% ../../nbs/Utils/99_UHelpers.ipynb 34
+class ResultCache:
+    """
+    On-disk cache of computation results, stored compressed in `directory`
+    and evicted least-recently-used when exceeding `maxbytes`.
+    """
+    def __init__(self,
+                 directory:str=None,  # defaults to `results` in the `cache_directory()`
+                 maxbytes:int=2**30):  # maximal total size of the cached files
+        self.directory = os.path.join(cache_directory(), 'results') \
+            if directory is None else directory
+        self.maxbytes = maxbytes
+    
+    @staticmethod
+    def key(*parts,  # strings, numbers or arrays identifying the computation
+            **settings  # further named parts
+           ) -> str:  # Hash of all parts
+        """Content hash of the `parts` and `settings` of a computation."""
+        h = hashlib.sha256()
+        for part in parts + tuple(sorted(settings.items())):
+            if isinstance(part, (np.ndarray, jax.Array)):
+                part = np.asarray(part)
+                h.update(f"{part.dtype}{part.shape}".encode())
+                h.update(np.ascontiguousarray(part).tobytes())
+            else:
+                h.update(repr(part).encode())
+        return h.hexdigest()
+    
+    def _filename(self, key): 
+        return os.path.join(self.directory, key + '.npz')
+    
+    def load(self,
+             key:str  # as returned by `key`
+            ) -> dict:  # stored arrays, None if not cached
+        """Load the result stored under `key`."""
+        try:
+            with np.load(self._filename(key)) as f:
+                result = {k: f[k] for k in f.files}
+        except (FileNotFoundError, ValueError, OSError):
+            return None
+        os.utime(self._filename(key))  # mark as recently used
+        return result
+    
+    def save(self,
+             key:str,  # as returned by `key`
+             **arrays):  # result to store
+        """Store the result `arrays` under `key` and evict old results."""
+        save_atomically(self._filename(key), **arrays)
+        self.evict()
+    
+    def evict(self):
+        """Remove the least recently used results until within `maxbytes`."""
+        files = [os.path.join(self.directory, f) for f in os.listdir(self.directory)
+                 if f.endswith('.npz')]
+        stats = sorted([(os.stat(f).st_mtime, os.stat(f).st_size, f) for f in files])
+        total = sum(size for _, size, _ in stats)
+        for _, size, f in stats:
+            if total <= self.maxbytes:
+                break
+            os.remove(f)
+            total -= size
+
+# %% ../../nbs/Utils/99_UHelpers.ipynb 38
+class TrajectoryWriter:
+    """
+    Collect the states of a trajectory every `stride` steps, 
+    either in memory or streamed to a memory-mapped `.npy` file.
+    """
+    def __init__(self,
+                 Xinit:np.ndarray,  # Initial state, determines shape and dtype
+                 Tmax:int,  # the maximum number of states to be written
+                 stride:int=1,  # keep every `stride`-th state
+                 filename:str=None,  # `.npy` file to write to, otherwise in memory
+                 chunksize:int=1000):  # number of kept states to buffer before writing
+        assert stride >= 1 and chunksize >= 1
+        self.stride, self.filename, self.chunksize = stride, filename, chunksize
+        self.shape, self.dtype = np.shape(Xinit), np.asarray(Xinit).dtype
+        self.maxlength = (Tmax - 1) // stride + 2  # including the final state
+        self.t = 0  # number of appended states
+        self.length = 0  # number of written states
+        self.buffer, self.chunks, self.last = [], [], None
+        self.saved = 0  # number of chunks written by `state`
+        
+        if filename is not None:
+            self.memmap = np.lib.format.open_memmap(
+                filename, mode='w+', dtype=self.dtype, 
+                shape=(self.maxlength,) + self.shape)
+
+    def append(self,
+               X:np.ndarray):  # State of the trajectory
+        """Append the next state `X`."""
+        if self.t % self.stride == 0:
+            self.buffer.append(X)
+            if len(self.buffer) >= self.chunksize:
+                self._flush()
+            self.last = None
+        else:
+            self.last = X  # to keep the final state
+        self.t += 1
+
+    def extend(self,
+               Xs:np.ndarray):  # States of the trajectory, one after the other
+        """Append the next states `Xs`."""
+        if len(Xs) == 0:
+            return
+        first = -self.t % self.stride  # index of the first state to keep
+        self.buffer.extend(Xs[first::self.stride])
+        self.last = None if (self.t + len(Xs) - 1) % self.stride == 0 else Xs[-1]
+        self.t += len(Xs)
+        if len(self.buffer) >= self.chunksize:
+            self._flush()
+    
+    def _flush(self):
+        if not self.buffer:
+            return
+        chunk = np.array(self.buffer)
+        if self.filename is None:
+            self.chunks.append(chunk)
+        else:
+            self.memmap[self.length:self.length+len(chunk)] = chunk
+        self.length += len(chunk)
+        self.buffer = []
+    
+    def close(self) -> np.ndarray:  # Trajectory, memory-mapped when written to a file
+        """Write the remaining states and return the trajectory."""
+        if self.last is not None:
+            self.buffer.append(self.last)
+            self.last = None
+        self._flush()
+        if self.filename is None:
+            return np.concatenate(self.chunks) if self.chunks else np.array([])
+        
+        # shrink the file to the number of written states
+        self.memmap.flush()
+        del self.memmap
+        self._resize(self.length)
+        return np.load(self.filename, mmap_mode='r')
+    
+    def _resize(self, length):
+        """Set the number of states stored in the `.npy` file."""
+        fmt = np.lib.format
+        with open(self.filename, 'r+b') as f:
+            v1 = fmt.read_magic(f) == (1, 0)
+            (fmt.read_array_header_1_0 if v1 else fmt.read_array_header_2_0)(f)
+            offset = f.tell()
+            f.seek(0)
+            header = dict(descr=fmt.dtype_to_descr(self.dtype),
+                          fortran_order=False, shape=(length,) + self.shape)
+            (fmt.write_array_header_1_0 if v1 else fmt.write_array_header_2_0)(f, header)
+            assert f.tell() == offset, 'Header does not fit'
+            f.truncate(offset + length * int(np.prod(self.shape)) 
+                       * self.dtype.itemsize)
+
+    def state(self,
+              statesfile:str=None  # raw file to append the new states to, when in memory
+             ) -> dict:  # Arrays to restore the writer with `from_state`
+        """
+        Write out the buffered states and return the state of the writer.
+        Only the states added since the last call are written.
+        """
+        self._flush()
+        state = dict(t=self.t, length=self.length, stride=self.stride,
+                     has_last=self.last is not None,
+                     last=np.zeros(self.shape, self.dtype) if self.last is None
+                          else self.last)
+        if self.filename is not None:
+            self.memmap.flush()
+        elif statesfile is not None:
+            new = self.chunks[self.saved:]
+            if new:
+                start = sum(len(chunk) for chunk in self.chunks[:self.saved])
+                append_rows(statesfile, np.concatenate(new), start)
+            self.saved = len(self.chunks)
+        else:
+            state['states'] = np.concatenate(
+                [np.zeros((0,) + self.shape, self.dtype)] + self.chunks)
+        return state
+    
+    @classmethod
+    def from_state(cls,
+                   Xinit:np.ndarray,  # Initial state, determines shape and dtype
+                   Tmax:int,  # the maximum number of states to be written
+                   state:dict,  # as returned by `state`
+                   filename:str=None,  # `.npy` file written to before
+                   chunksize:int=1000,  # number of kept states to buffer before writing
+                   statesfile:str=None):  # raw file passed to `state`, when in memory
+        """Restore a writer from its `state` to continue writing."""
+        writer = cls(Xinit, Tmax, int(state['stride']), chunksize=chunksize)
+        writer.t, writer.length = int(state['t']), int(state['length'])
+        writer.last = state['last'] if state['has_last'] else None
+        if filename is None and statesfile is not None:
+            writer.chunks = [read_rows(statesfile, writer.length, 
+                                       writer.dtype, writer.shape)]
+            writer.saved = 1
+        elif filename is None:
+            writer.chunks = [state['states']]
+        else:
+            writer.filename = filename
+            writer._resize(writer.maxlength)  # the file may have been closed
+            writer.memmap = np.lib.format.open_memmap(filename, mode='r+')
+        return writer
+
+# %% ../../nbs/Utils/99_UHelpers.ipynb 47
+def use_host_devices(n:int):  # number of CPU devices
+    """
+    Split the host CPU into `n` XLA devices, to run batches on several cores. 
+    Has to be called before any JAX computation.
+    """
+    jax.config.update('jax_num_cpu_devices', n)
+
+def device_mesh(workers:int=None  # number of devices to use, all if None
+               ) -> jax.sharding.Mesh:  # with a `batch` axis, None for a single device
+    """Mesh to shard batches across up to `workers` devices."""
+    devices = jax.devices()
+    workers = len(devices) if workers is None else min(workers, len(devices))
+    if workers <= 1:
+        return None
+    return jax.sharding.Mesh(np.array(devices[:workers]), ('batch',))
+
+def pad_batch(x,  # Array or pytree of arrays with a batch along the first axis
+              multiple:int  # the batch size shall be a multiple of
+             ):  # padded with copies of the first member
+    """Pad the batch `x` to a multiple of `multiple` members."""
+    def pad(a):
+        n = -len(a) % multiple
+        return jnp.concatenate([a, jnp.repeat(a[:1], n, axis=0)])
+    return jax.tree_util.tree_map(pad, x)
@@ -0,0 +1,119 @@
+"""Find out where the time of a computation goes"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/Utils/05_UProfiling.ipynb.
+
+# %% auto 0
+__all__ = ['Profiler']
+
+# %% ../../nbs/Utils/05_UProfiling.ipynb 4
+import json
+import time
+from typing import Iterable
+
+import jax
+
+# %% ../../nbs/Utils/05_UProfiling.ipynb 5
+class Profiler:
+    """
+    Record calls, compilations, execution times and cost estimates of the
+    agents' jitted methods, while used as a context manager.
+    """
+    methods = ('Tss', 'Tisas', 'Risa', 'Ris', 'Vis', 'Qisa', 'RPEisa',
+               'Tioo', 'Tioao', 'Rioa', 'Vio', 'RPEioa', 'step', 'reverse_step')
+    events = ('/jax/core/compile/jaxpr_trace_duration',
+              '/jax/core/compile/jaxpr_to_mlir_module_duration',
+              '/jax/core/compile/backend_compile_duration')
+    
+    def __init__(self,
+                 agents,  # CRLD multi-agent object, whose class gets instrumented
+                 methods:Iterable[str]=None):  # names of jitted methods to profile
+        self.cls = type(agents)
+        methods = self.methods if methods is None else methods
+        self.originals = {m: getattr(self.cls, m) for m in methods
+                          if hasattr(getattr(self.cls, m, None), 'lower')}
+        self.stats = {m: dict(calls=0, compilations=0, compile_time=0.0,
+                              execute_time=0.0, flops=None, bytes_accessed=None)
+                      for m in self.originals}
+        self._current = None  # top-level method being called
+        self._compiling = 0.0  # compile time of the current call
+        self._compiled = False  # whether the current call compiled
+    
+    def __enter__(self):
+        self._patched = {m: m in vars(self.cls) for m in self.originals}
+        for name, method in self.originals.items():
+            setattr(self.cls, name, self._instrument(name, method))
+        jax.monitoring.register_event_duration_secs_listener(self._listen)
+        return self
+    
+    def __exit__(self, *exc):
+        jax.monitoring.unregister_event_duration_listener(self._listen)
+        for name, method in self.originals.items():
+            if self._patched[name]:
+                setattr(self.cls, name, method)
+            else:  # inherited
+                delattr(self.cls, name)
+        return False
+    
+    def _listen(self, event, duration, **kwargs):
+        if self._current is not None and event in self.events:
+            self._compiling += duration
+            self._compiled |= event == self.events[-1]
+    
+    def _instrument(self, name, method):
+        profiler = self
+        
+        def instrumented(self, *args, **kwargs):
+            traced = any(isinstance(x, jax.core.Tracer) for x in
+                         jax.tree_util.tree_leaves((self, args, kwargs)))
+            if traced or profiler._current is not None:  # inside another method
+                return method(self, *args, **kwargs)
+            
+            profiler._current, profiler._compiling = name, 0.0
+            profiler._compiled = False
+            tic = time.perf_counter()
+            try:
+                out = jax.block_until_ready(method(self, *args, **kwargs))
+            finally:
+                total = time.perf_counter() - tic
+                profiler._current = None
+            
+            stats = profiler.stats[name]
+            stats['calls'] += 1
+            stats['compile_time'] += profiler._compiling
+            stats['execute_time'] += total - profiler._compiling
+            if profiler._compiled:  # for new arguments
+                stats['compilations'] += 1
+                cost = method.lower(self, *args, **kwargs).cost_analysis()
+                stats['flops'] = cost.get('flops')
+                stats['bytes_accessed'] = cost.get('bytes accessed')
+            return out
+        
+        instrumented.__name__ = name
+        instrumented.__doc__ = method.__doc__
+        return instrumented
+    
+    def summary(self) -> str:  # Table of the recorded statistics
+        """Summary table of the methods, sorted by their total time."""
+        lines = [f"{'method':14}{'calls':>8}{'compiles':>9}{'compile [s]':>13}"
+                 f"{'execute [s]':>13}{'per call [µs]':>15}{'flops':>10}{'bytes':>10}"]
+        order = sorted(self.stats, key=lambda m: -(self.stats[m]['compile_time'] 
+                                                   + self.stats[m]['execute_time']))
+        for m in order:
+            s = self.stats[m]
+            if s['calls'] == 0:
+                continue
+            lines.append(
+                f"{m:14}{s['calls']:8d}{s['compilations']:9d}{s['compile_time']:13.3f}"
+                f"{s['execute_time']:13.3f}{1e6*s['execute_time']/s['calls']:15.1f}"
+                f"{s['flops'] or 0:10.0f}{s['bytes_accessed'] or 0:10.0f}")
+        return "\n".join(lines)
+    
+    def to_json(self,
+                filename:str=None  # to write the statistics to
+               ) -> str:  # JSON of the recorded statistics
+        """Recorded statistics as JSON."""
+        dump = json.dumps(dict(agents=self.cls.__name__, methods=self.stats), indent=1)
+        if filename is not None:
+            with open(filename, 'w') as f:
+                f.write(dump)
+        return dump
@@ -0,0 +1,138 @@
+"""Linear stability analysis of the learning dynamics"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/Utils/02_UStability.ipynb.
+
+# %% auto 0
+__all__ = ['tangent_jacobians', 'StabilityAnalysis', 'stability_analysis', 'trace_separatrices']
+
+# %% ../../nbs/Utils/02_UStability.ipynb 4
+from typing import NamedTuple
+from functools import partial
+
+import jax
+import numpy as np
+import jax.numpy as jnp
+from jax import jit
+
+# %% ../../nbs/Utils/02_UStability.ipynb 7
+@partial(jit, static_argnums=2)
+def tangent_jacobians(agents,  # CRLD multi-agent object
+                      Xs:jnp.ndarray,  # Batch of joint strategies [b, i, s, a]
+                      reverse:bool=False  # use `reverse_step` instead of `step`?
+                     ) -> jnp.ndarray:  # Jacobians [b, isa', isa'] with a' < M-1
+    """
+    Jacobians of the learning `step` at the joint strategies `Xs`, 
+    restricted to the tangent space of the strategy simplices.
+    """
+    agents = agents._differentiable()
+    step = agents.reverse_step if reverse else agents.step
+    
+    def jacobian(X):
+        J = jax.jacfwd(lambda X: step(X)[0])(X)  # [i, s, a, j, z, b]
+        # the last action's probability depends on all others
+        J = J[:, :, :-1, :, :, :-1] - J[:, :, :-1, :, :, -1:]
+        D = J.shape[0] * J.shape[1] * J.shape[2]
+        return J.reshape(D, D)
+    
+    return jax.vmap(jacobian)(Xs)
+
+# %% ../../nbs/Utils/02_UStability.ipynb 9
+class StabilityAnalysis(NamedTuple):
+    """Linear stability of the learning dynamics at a batch of points."""
+    eigenvalues: np.ndarray  # of the tangent Jacobians [b, d]
+    spectral_radius: np.ndarray  # largest absolute eigenvalue [b]
+    unstable_dimension: np.ndarray  # number of eigenvalues outside the unit circle [b]
+
+# %% ../../nbs/Utils/02_UStability.ipynb 10
+def stability_analysis(agents,  # CRLD multi-agent object
+                       Xs:jnp.ndarray,  # Joint strategy [i, s, a] or batch of them
+                       reverse:bool=False,  # use `reverse_step` instead of `step`?
+                       tolerance:float=1e-6  # for eigenvalues on the unit circle
+                      ) -> StabilityAnalysis:
+    """
+    Eigenvalues, spectral radius and dimension of the unstable manifold 
+    of the learning map at the joint strategies `Xs`.
+    """
+    Xs = jnp.asarray(Xs)
+    single = Xs.ndim == 3
+    Jacs = tangent_jacobians(agents, Xs[None] if single else Xs, reverse)
+    
+    eigenvalues = np.linalg.eigvals(np.array(Jacs, dtype=np.float64))
+    radius = np.abs(eigenvalues).max(-1)
+    unstable = (np.abs(eigenvalues) > 1 + tolerance).sum(-1)
+    
+    result = StabilityAnalysis(eigenvalues, radius, unstable)
+    return StabilityAnalysis(*(r[0] for r in result)) if single else result
+
+# %% ../../nbs/Utils/02_UStability.ipynb 22
+@partial(jit, static_argnums=2)
+def _reverse_trajectories(agents,  # CRLD multi-agent object
+                          Xs:jnp.ndarray,  # Batch of initial joint strategies
+                          Tmax:int,  # the maximum number of iteration steps
+                          boundary:float,  # minimal probability of the interior
+                          tolerance:float):  # to determine if a fix point is reached
+    """
+    Batched `reverse_step` loop, stopping members that leave the interior
+    of the strategy space or reach a fixed point.
+    """
+    B = Xs.shape[0]  # batch size
+    n = (slice(None),) + (np.newaxis,)*(Xs.ndim-1)  # to broadcast masks
+    vstep = jax.vmap(agents.reverse_step)
+
+    def cond(carry):
+        t, X, traj, done, steps = carry
+        return jnp.logical_and(~jnp.all(done), t < Tmax)
+
+    def body(carry):
+        t, X, traj, done, steps = carry
+        X_, TDe = vstep(X)
+        inside = jnp.all(X_.reshape(B, -1) > boundary, axis=-1)  # False for NaN
+        converged = jnp.linalg.norm((X_ - X).reshape(B, -1), axis=-1)\
+            < tolerance
+        
+        moves = ~done & inside
+        steps = steps + moves
+        X = jnp.where(moves[n], X_, X)
+        done = done | ~inside | converged
+        return t+1, X, traj.at[t+1].set(X), done, steps
+
+    traj = jnp.zeros((Tmax+1,) + Xs.shape, dtype=Xs.dtype).at[0].set(Xs)
+    carry = (jnp.array(0), Xs, traj, jnp.zeros(B, bool), jnp.zeros(B, int))
+    t, X, traj, done, steps = jax.lax.while_loop(cond, body, carry)
+    return jnp.swapaxes(traj, 0, 1), steps
+
+# %% ../../nbs/Utils/02_UStability.ipynb 23
+def trace_separatrices(agents,  # CRLD multi-agent object
+                       saddles:jnp.ndarray,  # Fixed points [k, i, s, a]
+                       Tmax:int=1000,  # the maximum number of reverse steps
+                       distance:float=1e-3,  # of the seeds from the saddles
+                       boundary:float=1e-4,  # minimal probability of the interior
+                       tolerance:float=1e-6  # to determine if a fix point is reached
+                      ) -> list:  # Polylines of joint strategies [t, i, s, a]
+    """
+    Trace the stable manifolds of the `saddles` with `reverse_step`,
+    starting at both sides along each stable eigenvector.
+    """
+    saddles = jnp.asarray(saddles)
+    Jacs = np.array(tangent_jacobians(agents, saddles), dtype=np.float64)
+    
+    origins, seeds = [], []
+    for X, J in zip(np.array(saddles), Jacs):
+        eigenvalues, eigenvectors = np.linalg.eig(J)
+        if np.all(np.abs(eigenvalues) <= 1):
+            continue  # not a saddle
+        for v in eigenvectors.T[np.abs(eigenvalues) < 1]:
+            v = v.real.reshape(X[..., :-1].shape)
+            dX = np.concatenate([v, -v.sum(-1, keepdims=True)], axis=-1)
+            dX = distance * dX / np.abs(dX).max()
+            origins += [X, X]
+            seeds += [X + dX, X - dX]
+    if not seeds:
+        return []
+    
+    trajs, steps = _reverse_trajectories(
+        agents, jnp.array(np.array(seeds), dtype=saddles.dtype), Tmax, 
+        boundary, tolerance)
+    trajs, steps = np.array(trajs), np.array(steps)
+    return [np.concatenate([X[np.newaxis], traj[:T+1]]) 
+            for X, traj, T in zip(origins, trajs, steps)]
@@ -0,0 +1,12 @@
+"""Utilities, imported on first access of their class or function."""
+from .. import _lazy_package
+
+_modules = {'plot_strategy_flow': 'FlowPlot', 'plot_trajectories': 'FlowPlot',
+            'ResultCache': 'Helpers', 'TrajectoryWriter': 'Helpers',
+            'StabilityAnalysis': 'Stability', 'stability_analysis': 'Stability',
+            'trace_separatrices': 'Stability',
+            'basins_of_attraction': 'Basins',
+            'RandomEnvironment': 'Benchmarks', 'run_benchmarks': 'Benchmarks',
+            'import_times': 'Benchmarks',
+            'Profiler': 'Profiling'}
+__all__ = _lazy_package(__name__, _modules)
@@ -1 +1,39 @@
 __version__ = "0.0.1"
+
+import sys
+import types
+import importlib
+import importlib.util
+
+def _lazy_package(name:str,  # of the package
+                  modules:dict  # module within the package of each attribute
+                 ) -> list:  # names of the attributes
+    """
+    Give the package `name` the attributes in `modules`, imported on first access.
+    Attributes must not be named like a module, which keeps its name. Accessing
+    a module imports it, e.g., for classes named like their module.
+    """
+    assert not set(modules) & set(modules.values()), "Attribute named like a module"
+    class LazyPackage(types.ModuleType):
+        def __getattr__(self, attr):
+            if attr not in modules and not attr.startswith('_')\
+                    and importlib.util.find_spec(f'{name}.{attr}'):
+                return importlib.import_module(f'.{attr}', name)
+            if attr not in modules:
+                raise AttributeError(f"module {name!r} has no attribute {attr!r}")
+            value = getattr(importlib.import_module(f'.{modules[attr]}', name), attr)
+            setattr(self, attr, value)
+            return value
+
+        def __dir__(self):
+            return sorted(set(super().__dir__()) | set(modules))
+
+    sys.modules[name].__class__ = LazyPackage
+    return list(modules)
+
+_subpackages = ('Agents', 'Environments', 'Utils')
+
+def __getattr__(name):  # import the subpackages on first access
+    if name not in _subpackages:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(f'.{name}', __name__)
@@ -5,7 +5,30 @@ d = { 'settings': { 'branch': 'main',
                 'doc_host': 'https://wbarfuss.github.io',
                 'git_url': 'https://github.com/wbarfuss/pyCRLD',
                 'lib_path': 'pyCRLD'},
-  'syms': { 'pyCRLD.Agents.Base': { 'pyCRLD.Agents.Base.abase': ('Agents/abase.html#abase', 'pyCRLD/Agents/Base.py'),
+  'syms': { 'pyCRLD.Agents.Base': { 'pyCRLD.Agents.Base.Evaluation': ('Agents/abase.html#evaluation', 'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base._BoundMethod': ('Agents/abase.html#_boundmethod', 'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base._SummationTensor': ('Agents/abase.html#_summationtensor', 'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base._Uncompared': ('Agents/abase.html#_uncompared', 'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base._Uncompared.__eq__': ( 'Agents/abase.html#_uncompared.__eq__',
+                                                                               'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base._Uncompared.__hash__': ( 'Agents/abase.html#_uncompared.__hash__',
+                                                                                 'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base._Uncompared.__init__': ( 'Agents/abase.html#_uncompared.__init__',
+                                                                                 'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base._compiled_sweep': ('Agents/abase.html#_compiled_sweep', 'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base._compiled_trajectories': ( 'Agents/abase.html#_compiled_trajectories',
+                                                                                   'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base._compiled_trajectory': ( 'Agents/abase.html#_compiled_trajectory',
+                                                                                 'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base._isleaf': ('Agents/abase.html#_isleaf', 'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base._record_compile_event': ( 'Agents/abase.html#_record_compile_event',
+                                                                                  'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base._sharded_sweep': ('Agents/abase.html#_sharded_sweep', 'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base._sharded_trajectories': ( 'Agents/abase.html#_sharded_trajectories',
+                                                                                  'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base._trajectory_block': ( 'Agents/abase.html#_trajectory_block',
+                                                                              'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base.abase': ('Agents/abase.html#abase', 'pyCRLD/Agents/Base.py'),
                                     'pyCRLD.Agents.Base.abase.Ps': ('Agents/abase.html#abase.ps', 'pyCRLD/Agents/Base.py'),
                                     'pyCRLD.Agents.Base.abase.Qisa': ('Agents/abase.html#abase.qisa', 'pyCRLD/Agents/Base.py'),
                                     'pyCRLD.Agents.Base.abase.Ri': ('Agents/abase.html#abase.ri', 'pyCRLD/Agents/Base.py'),
@@ -14,12 +37,55 @@ d = { 'settings': { 'branch': 'main',
                                     'pyCRLD.Agents.Base.abase.Tisas': ('Agents/abase.html#abase.tisas', 'pyCRLD/Agents/Base.py'),
                                     'pyCRLD.Agents.Base.abase.Tss': ('Agents/abase.html#abase.tss', 'pyCRLD/Agents/Base.py'),
                                     'pyCRLD.Agents.Base.abase.Vis': ('Agents/abase.html#abase.vis', 'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base.abase._ContractStrategies': ( 'Agents/abase.html#abase._contractstrategies',
+                                                                                      'pyCRLD/Agents/Base.py'),
                                     'pyCRLD.Agents.Base.abase._OtherAgentsActionsSummationTensor': ( 'Agents/abase.html#abase._otheragentsactionssummationtensor',
                                                                                                      'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base.abase._OtherAgentsAverage': ( 'Agents/abase.html#abase._otheragentsaverage',
+                                                                                      'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base.abase._SolveValues': ( 'Agents/abase.html#abase._solvevalues',
+                                                                               'pyCRLD/Agents/Base.py'),
                                     'pyCRLD.Agents.Base.abase.__init__': ('Agents/abase.html#abase.__init__', 'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base.abase.__init_subclass__': ( 'Agents/abase.html#abase.__init_subclass__',
+                                                                                    'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base.abase._cache_key': ('Agents/abase.html#abase._cache_key', 'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base.abase._compile_calls': ( 'Agents/abase.html#abase._compile_calls',
+                                                                                 'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base.abase._differentiable': ( 'Agents/abase.html#abase._differentiable',
+                                                                                  'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base.abase._initial_values': ( 'Agents/abase.html#abase._initial_values',
+                                                                                  'pyCRLD/Agents/Base.py'),
                                     'pyCRLD.Agents.Base.abase._jaxPs': ('Agents/abase.html#abase._jaxps', 'pyCRLD/Agents/Base.py'),
                                     'pyCRLD.Agents.Base.abase._numpyPs': ('Agents/abase.html#abase._numpyps', 'pyCRLD/Agents/Base.py'),
-                                    'pyCRLD.Agents.Base.abase.trajectory': ('Agents/abase.html#abase.trajectory', 'pyCRLD/Agents/Base.py')},
+                                    'pyCRLD.Agents.Base.abase._run_block': ('Agents/abase.html#abase._run_block', 'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base.abase._save_checkpoint': ( 'Agents/abase.html#abase._save_checkpoint',
+                                                                                   'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base.abase._trajectories_loop': ( 'Agents/abase.html#abase._trajectories_loop',
+                                                                                     'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base.abase._trajectories_segments': ( 'Agents/abase.html#abase._trajectories_segments',
+                                                                                         'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base.abase._trajectory_loop': ( 'Agents/abase.html#abase._trajectory_loop',
+                                                                                   'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base.abase._use_blocks': ( 'Agents/abase.html#abase._use_blocks',
+                                                                              'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base.abase._with_parameters': ( 'Agents/abase.html#abase._with_parameters',
+                                                                                   'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base.abase.compile': ('Agents/abase.html#abase.compile', 'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base.abase.compiled_trajectory': ( 'Agents/abase.html#abase.compiled_trajectory',
+                                                                                      'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base.abase.resume': ('Agents/abase.html#abase.resume', 'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base.abase.sweep': ('Agents/abase.html#abase.sweep', 'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base.abase.trajectories': ( 'Agents/abase.html#abase.trajectories',
+                                                                               'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base.abase.trajectory': ('Agents/abase.html#abase.trajectory', 'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base.abase.tree_flatten': ( 'Agents/abase.html#abase.tree_flatten',
+                                                                               'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base.abase.tree_unflatten': ( 'Agents/abase.html#abase.tree_unflatten',
+                                                                                 'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base.evaluate': ('Agents/abase.html#evaluate', 'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base.stationary_Ps': ('Agents/abase.html#stationary_ps', 'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base.stationary_Ri': ('Agents/abase.html#stationary_ri', 'pyCRLD/Agents/Base.py'),
+                                    'pyCRLD.Agents.Base.trajectory_Ri': ('Agents/abase.html#trajectory_ri', 'pyCRLD/Agents/Base.py')},
             'pyCRLD.Agents.POBase': { 'pyCRLD.Agents.POBase.aPObase': ('Agents/apobase.html#apobase', 'pyCRLD/Agents/POBase.py'),
                                       'pyCRLD.Agents.POBase.aPObase.Bios': ('Agents/apobase.html#apobase.bios', 'pyCRLD/Agents/POBase.py'),
                                       'pyCRLD.Agents.POBase.aPObase.Qioa': ('Agents/apobase.html#apobase.qioa', 'pyCRLD/Agents/POBase.py'),
@@ -49,7 +115,11 @@ d = { 'settings': { 'branch': 'main',
                                       'pyCRLD.Agents.POBase.aPObase.fast_Bios': ( 'Agents/apobase.html#apobase.fast_bios',
                                                                                   'pyCRLD/Agents/POBase.py'),
                                       'pyCRLD.Agents.POBase.aPObase.obsdist': ( 'Agents/apobase.html#apobase.obsdist',
-                                                                                'pyCRLD/Agents/POBase.py')},
+                                                                                'pyCRLD/Agents/POBase.py'),
+                                      'pyCRLD.Agents.POBase.aPObase.stationary_Ri': ( 'Agents/apobase.html#apobase.stationary_ri',
+                                                                                      'pyCRLD/Agents/POBase.py'),
+                                      'pyCRLD.Agents.POBase.aPObase.stationary_obsdist': ( 'Agents/apobase.html#apobase.stationary_obsdist',
+                                                                                           'pyCRLD/Agents/POBase.py')},
             'pyCRLD.Agents.POStrategyActorCritic': { 'pyCRLD.Agents.POStrategyActorCritic.POstratAC': ( 'Agents/apostrategyactorcritic.html#postratac',
                                                                                                         'pyCRLD/Agents/POStrategyActorCritic.py'),
                                                      'pyCRLD.Agents.POStrategyActorCritic.POstratAC.NextVioa': ( 'Agents/apostrategyactorcritic.html#postratac.nextvioa',
@@ -70,10 +140,20 @@ d = { 'settings': { 'branch': 'main',
                                                                                                            'pyCRLD/Agents/StrategyActorCritic.py'),
                                                    'pyCRLD.Agents.StrategyActorCritic.stratAC.RPEisa': ( 'Agents/astrategyactorcritic.html#stratac.rpeisa',
                                                                                                          'pyCRLD/Agents/StrategyActorCritic.py')},
-            'pyCRLD.Agents.StrategyBase': { 'pyCRLD.Agents.StrategyBase.strategybase': ( 'Agents/astrategybase.html#strategybase',
+            'pyCRLD.Agents.StrategyBase': { 'pyCRLD.Agents.StrategyBase._logits2strategy': ( 'Agents/astrategybase.html#_logits2strategy',
+                                                                                             'pyCRLD/Agents/StrategyBase.py'),
+                                            'pyCRLD.Agents.StrategyBase._newton_fixedpoint': ( 'Agents/astrategybase.html#_newton_fixedpoint',
+                                                                                               'pyCRLD/Agents/StrategyBase.py'),
+                                            'pyCRLD.Agents.StrategyBase.strategybase': ( 'Agents/astrategybase.html#strategybase',
                                                                                          'pyCRLD/Agents/StrategyBase.py'),
                                             'pyCRLD.Agents.StrategyBase.strategybase.__init__': ( 'Agents/astrategybase.html#strategybase.__init__',
                                                                                                   'pyCRLD/Agents/StrategyBase.py'),
+                                            'pyCRLD.Agents.StrategyBase.strategybase._attracting': ( 'Agents/astrategybase.html#strategybase._attracting',
+                                                                                                     'pyCRLD/Agents/StrategyBase.py'),
+                                            'pyCRLD.Agents.StrategyBase.strategybase.find_fixedpoint': ( 'Agents/astrategybase.html#strategybase.find_fixedpoint',
+                                                                                                         'pyCRLD/Agents/StrategyBase.py'),
+                                            'pyCRLD.Agents.StrategyBase.strategybase.find_fixedpoints': ( 'Agents/astrategybase.html#strategybase.find_fixedpoints',
+                                                                                                          'pyCRLD/Agents/StrategyBase.py'),
                                             'pyCRLD.Agents.StrategyBase.strategybase.id': ( 'Agents/astrategybase.html#strategybase.id',
                                                                                             'pyCRLD/Agents/StrategyBase.py'),
                                             'pyCRLD.Agents.StrategyBase.strategybase.random_softmax_strategy': ( 'Agents/astrategybase.html#strategybase.random_softmax_strategy',
@@ -99,6 +179,10 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                  'pyCRLD/Agents/ValueBase.py'),
                                          'pyCRLD.Agents.ValueBase.multiagent_epsilongreedy_strategy.id': ( 'Agents/avaluebase.html#multiagent_epsilongreedy_strategy.id',
                                                                                                            'pyCRLD/Agents/ValueBase.py'),
+                                         'pyCRLD.Agents.ValueBase.multiagent_epsilongreedy_strategy.tree_flatten': ( 'Agents/avaluebase.html#multiagent_epsilongreedy_strategy.tree_flatten',
+                                                                                                                     'pyCRLD/Agents/ValueBase.py'),
+                                         'pyCRLD.Agents.ValueBase.multiagent_epsilongreedy_strategy.tree_unflatten': ( 'Agents/avaluebase.html#multiagent_epsilongreedy_strategy.tree_unflatten',
+                                                                                                                       'pyCRLD/Agents/ValueBase.py'),
                                          'pyCRLD.Agents.ValueBase.step': ('Agents/avaluebase.html#step', 'pyCRLD/Agents/ValueBase.py'),
                                          'pyCRLD.Agents.ValueBase.valuebase': ( 'Agents/avaluebase.html#valuebase',
                                                                                 'pyCRLD/Agents/ValueBase.py'),
@@ -274,6 +358,35 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                       'pyCRLD/Environments/UncertainSocialDilemma.py'),
                                                             'pyCRLD.Environments.UncertainSocialDilemma.UncertainSocialDilemma.states': ( 'Environments/envuncertainsocialdilemma.html#uncertainsocialdilemma.states',
                                                                                                                                           'pyCRLD/Environments/UncertainSocialDilemma.py')},
+            'pyCRLD.Utils.Basins': { 'pyCRLD.Utils.Basins.Basins': ('Utils/ubasins.html#basins', 'pyCRLD/Utils/Basins.py'),
+                                     'pyCRLD.Utils.Basins._basins_segment': ( 'Utils/ubasins.html#_basins_segment',
+                                                                              'pyCRLD/Utils/Basins.py'),
+                                     'pyCRLD.Utils.Basins._distances': ('Utils/ubasins.html#_distances', 'pyCRLD/Utils/Basins.py'),
+                                     'pyCRLD.Utils.Basins.basins_of_attraction': ( 'Utils/ubasins.html#basins_of_attraction',
+                                                                                   'pyCRLD/Utils/Basins.py'),
+                                     'pyCRLD.Utils.Basins.grid_strategies': ( 'Utils/ubasins.html#grid_strategies',
+                                                                              'pyCRLD/Utils/Basins.py'),
+                                     'pyCRLD.Utils.Basins.lhs_strategies': ('Utils/ubasins.html#lhs_strategies', 'pyCRLD/Utils/Basins.py')},
+            'pyCRLD.Utils.Benchmarks': { 'pyCRLD.Utils.Benchmarks.RandomEnvironment': ( 'Utils/ubenchmarks.html#randomenvironment',
+                                                                                        'pyCRLD/Utils/Benchmarks.py'),
+                                         'pyCRLD.Utils.Benchmarks.RandomEnvironment.RewardTensor': ( 'Utils/ubenchmarks.html#randomenvironment.rewardtensor',
+                                                                                                     'pyCRLD/Utils/Benchmarks.py'),
+                                         'pyCRLD.Utils.Benchmarks.RandomEnvironment.TransitionTensor': ( 'Utils/ubenchmarks.html#randomenvironment.transitiontensor',
+                                                                                                         'pyCRLD/Utils/Benchmarks.py'),
+                                         'pyCRLD.Utils.Benchmarks.RandomEnvironment.__init__': ( 'Utils/ubenchmarks.html#randomenvironment.__init__',
+                                                                                                 'pyCRLD/Utils/Benchmarks.py'),
+                                         'pyCRLD.Utils.Benchmarks.RandomEnvironment.id': ( 'Utils/ubenchmarks.html#randomenvironment.id',
+                                                                                           'pyCRLD/Utils/Benchmarks.py'),
+                                         'pyCRLD.Utils.Benchmarks.benchmark': ( 'Utils/ubenchmarks.html#benchmark',
+                                                                                'pyCRLD/Utils/Benchmarks.py'),
+                                         'pyCRLD.Utils.Benchmarks.benchmark_environments': ( 'Utils/ubenchmarks.html#benchmark_environments',
+                                                                                             'pyCRLD/Utils/Benchmarks.py'),
+                                         'pyCRLD.Utils.Benchmarks.compare_benchmarks': ( 'Utils/ubenchmarks.html#compare_benchmarks',
+                                                                                         'pyCRLD/Utils/Benchmarks.py'),
+                                         'pyCRLD.Utils.Benchmarks.import_times': ( 'Utils/ubenchmarks.html#import_times',
+                                                                                   'pyCRLD/Utils/Benchmarks.py'),
+                                         'pyCRLD.Utils.Benchmarks.run_benchmarks': ( 'Utils/ubenchmarks.html#run_benchmarks',
+                                                                                     'pyCRLD/Utils/Benchmarks.py')},
             'pyCRLD.Utils.FlowPlot': { 'pyCRLD.Utils.FlowPlot._checks_and_balances': ( 'Utils/uflowplot.html#_checks_and_balances',
                                                                                        'pyCRLD/Utils/FlowPlot.py'),
                                        'pyCRLD.Utils.FlowPlot._dTDerror_s': ( 'Utils/uflowplot.html#_dtderror_s',
@@ -291,7 +404,79 @@ d = { 'settings': { 'branch': 'main',
                                                                                      'pyCRLD/Utils/FlowPlot.py'),
                                        'pyCRLD.Utils.FlowPlot.plot_trajectories': ( 'Utils/uflowplot.html#plot_trajectories',
                                                                                     'pyCRLD/Utils/FlowPlot.py')},
-            'pyCRLD.Utils.Helpers': { 'pyCRLD.Utils.Helpers.compute_stationarydistribution': ( 'Utils/uhelpers.html#compute_stationarydistribution',
+            'pyCRLD.Utils.Helpers': { 'pyCRLD.Utils.Helpers.ResultCache': ('Utils/uhelpers.html#resultcache', 'pyCRLD/Utils/Helpers.py'),
+                                      'pyCRLD.Utils.Helpers.ResultCache.__init__': ( 'Utils/uhelpers.html#resultcache.__init__',
+                                                                                     'pyCRLD/Utils/Helpers.py'),
+                                      'pyCRLD.Utils.Helpers.ResultCache._filename': ( 'Utils/uhelpers.html#resultcache._filename',
+                                                                                      'pyCRLD/Utils/Helpers.py'),
+                                      'pyCRLD.Utils.Helpers.ResultCache.evict': ( 'Utils/uhelpers.html#resultcache.evict',
+                                                                                  'pyCRLD/Utils/Helpers.py'),
+                                      'pyCRLD.Utils.Helpers.ResultCache.key': ( 'Utils/uhelpers.html#resultcache.key',
+                                                                                'pyCRLD/Utils/Helpers.py'),
+                                      'pyCRLD.Utils.Helpers.ResultCache.load': ( 'Utils/uhelpers.html#resultcache.load',
+                                                                                 'pyCRLD/Utils/Helpers.py'),
+                                      'pyCRLD.Utils.Helpers.ResultCache.save': ( 'Utils/uhelpers.html#resultcache.save',
+                                                                                 'pyCRLD/Utils/Helpers.py'),
+                                      'pyCRLD.Utils.Helpers.TrajectoryWriter': ( 'Utils/uhelpers.html#trajectorywriter',
+                                                                                 'pyCRLD/Utils/Helpers.py'),
+                                      'pyCRLD.Utils.Helpers.TrajectoryWriter.__init__': ( 'Utils/uhelpers.html#trajectorywriter.__init__',
+                                                                                          'pyCRLD/Utils/Helpers.py'),
+                                      'pyCRLD.Utils.Helpers.TrajectoryWriter._flush': ( 'Utils/uhelpers.html#trajectorywriter._flush',
+                                                                                        'pyCRLD/Utils/Helpers.py'),
+                                      'pyCRLD.Utils.Helpers.TrajectoryWriter._resize': ( 'Utils/uhelpers.html#trajectorywriter._resize',
+                                                                                         'pyCRLD/Utils/Helpers.py'),
+                                      'pyCRLD.Utils.Helpers.TrajectoryWriter.append': ( 'Utils/uhelpers.html#trajectorywriter.append',
+                                                                                        'pyCRLD/Utils/Helpers.py'),
+                                      'pyCRLD.Utils.Helpers.TrajectoryWriter.close': ( 'Utils/uhelpers.html#trajectorywriter.close',
+                                                                                       'pyCRLD/Utils/Helpers.py'),
+                                      'pyCRLD.Utils.Helpers.TrajectoryWriter.extend': ( 'Utils/uhelpers.html#trajectorywriter.extend',
+                                                                                        'pyCRLD/Utils/Helpers.py'),
+                                      'pyCRLD.Utils.Helpers.TrajectoryWriter.from_state': ( 'Utils/uhelpers.html#trajectorywriter.from_state',
+                                                                                            'pyCRLD/Utils/Helpers.py'),
+                                      'pyCRLD.Utils.Helpers.TrajectoryWriter.state': ( 'Utils/uhelpers.html#trajectorywriter.state',
+                                                                                       'pyCRLD/Utils/Helpers.py'),
+                                      'pyCRLD.Utils.Helpers.append_rows': ('Utils/uhelpers.html#append_rows', 'pyCRLD/Utils/Helpers.py'),
+                                      'pyCRLD.Utils.Helpers.cache_directory': ( 'Utils/uhelpers.html#cache_directory',
+                                                                                'pyCRLD/Utils/Helpers.py'),
+                                      'pyCRLD.Utils.Helpers.compute_stationarydistribution': ( 'Utils/uhelpers.html#compute_stationarydistribution',
                                                                                                'pyCRLD/Utils/Helpers.py'),
+                                      'pyCRLD.Utils.Helpers.device_mesh': ('Utils/uhelpers.html#device_mesh', 'pyCRLD/Utils/Helpers.py'),
                                       'pyCRLD.Utils.Helpers.make_variable_vector': ( 'Utils/uhelpers.html#make_variable_vector',
-                                                                                     'pyCRLD/Utils/Helpers.py')}}}
+                                                                                     'pyCRLD/Utils/Helpers.py'),
+                                      'pyCRLD.Utils.Helpers.pad_batch': ('Utils/uhelpers.html#pad_batch', 'pyCRLD/Utils/Helpers.py'),
+                                      'pyCRLD.Utils.Helpers.power_stationarydistribution': ( 'Utils/uhelpers.html#power_stationarydistribution',
+                                                                                             'pyCRLD/Utils/Helpers.py'),
+                                      'pyCRLD.Utils.Helpers.read_rows': ('Utils/uhelpers.html#read_rows', 'pyCRLD/Utils/Helpers.py'),
+                                      'pyCRLD.Utils.Helpers.save_atomically': ( 'Utils/uhelpers.html#save_atomically',
+                                                                                'pyCRLD/Utils/Helpers.py'),
+                                      'pyCRLD.Utils.Helpers.solve_stationarydistribution': ( 'Utils/uhelpers.html#solve_stationarydistribution',
+                                                                                             'pyCRLD/Utils/Helpers.py'),
+                                      'pyCRLD.Utils.Helpers.use_compilation_cache': ( 'Utils/uhelpers.html#use_compilation_cache',
+                                                                                      'pyCRLD/Utils/Helpers.py'),
+                                      'pyCRLD.Utils.Helpers.use_host_devices': ( 'Utils/uhelpers.html#use_host_devices',
+                                                                                 'pyCRLD/Utils/Helpers.py')},
+            'pyCRLD.Utils.Profiling': { 'pyCRLD.Utils.Profiling.Profiler': ('Utils/uprofiling.html#profiler', 'pyCRLD/Utils/Profiling.py'),
+                                        'pyCRLD.Utils.Profiling.Profiler.__enter__': ( 'Utils/uprofiling.html#profiler.__enter__',
+                                                                                       'pyCRLD/Utils/Profiling.py'),
+                                        'pyCRLD.Utils.Profiling.Profiler.__exit__': ( 'Utils/uprofiling.html#profiler.__exit__',
+                                                                                      'pyCRLD/Utils/Profiling.py'),
+                                        'pyCRLD.Utils.Profiling.Profiler.__init__': ( 'Utils/uprofiling.html#profiler.__init__',
+                                                                                      'pyCRLD/Utils/Profiling.py'),
+                                        'pyCRLD.Utils.Profiling.Profiler._instrument': ( 'Utils/uprofiling.html#profiler._instrument',
+                                                                                         'pyCRLD/Utils/Profiling.py'),
+                                        'pyCRLD.Utils.Profiling.Profiler._listen': ( 'Utils/uprofiling.html#profiler._listen',
+                                                                                     'pyCRLD/Utils/Profiling.py'),
+                                        'pyCRLD.Utils.Profiling.Profiler.summary': ( 'Utils/uprofiling.html#profiler.summary',
+                                                                                     'pyCRLD/Utils/Profiling.py'),
+                                        'pyCRLD.Utils.Profiling.Profiler.to_json': ( 'Utils/uprofiling.html#profiler.to_json',
+                                                                                     'pyCRLD/Utils/Profiling.py')},
+            'pyCRLD.Utils.Stability': { 'pyCRLD.Utils.Stability.StabilityAnalysis': ( 'Utils/ustability.html#stabilityanalysis',
+                                                                                      'pyCRLD/Utils/Stability.py'),
+                                        'pyCRLD.Utils.Stability._reverse_trajectories': ( 'Utils/ustability.html#_reverse_trajectories',
+                                                                                          'pyCRLD/Utils/Stability.py'),
+                                        'pyCRLD.Utils.Stability.stability_analysis': ( 'Utils/ustability.html#stability_analysis',
+                                                                                       'pyCRLD/Utils/Stability.py'),
+                                        'pyCRLD.Utils.Stability.tangent_jacobians': ( 'Utils/ustability.html#tangent_jacobians',
+                                                                                      'pyCRLD/Utils/Stability.py'),
+                                        'pyCRLD.Utils.Stability.trace_separatrices': ( 'Utils/ustability.html#trace_separatrices',
+                                                                                       'pyCRLD/Utils/Stability.py')}}}